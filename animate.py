@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+This is the evolution animation exporter for the Point-Scattering Problem
+implementations.
+
+Streams the best individual of every generation from a text log (full or
+compact) or a binary trajectory store and writes it as a GIF or MP4 of the
+points spreading out. One figure is drawn once; each frame only redraws the
+points and the generation counter over the saved background (blitting),
+and is written out before the next is read, so memory holds a single frame
+however long the run.
+
+    python animate.py logs/polar_n5_gen200.txt --out polar_n5.gif
+    python animate.py logs/polar_n5_gen200.npy --run 3 --out polar_n5.mp4 --fps 30
+    python animate.py logs/cartesian_n25_gen200.txt --out c.gif --every 5
+
+MP4 output pipes raw frames to ffmpeg, which must be on the PATH.
+"""
+# Standard libraries or third-party packages
+import argparse
+import os
+import shutil
+import subprocess
+import numpy as np
+
+# Local Imports
+import plotting
+import trajectory
+
+# ===================== FRAME SOURCES =====================
+def _text_title(path):
+    """'<Label> Representation' from the first header line of a text log"""
+    with open(path) as log_file:
+        first = log_file.readline().strip()
+    return first[:-len(" Log")] if first.endswith(" Log") else os.path.basename(path)
+
+def iter_frames(path, run=-1):
+    """
+    Streams (title, generation, (n, 2) X,Y array) from a text log or a
+    binary store (.npy, one run of it)
+    """
+    if path.endswith(".npy"):
+        header, store = trajectory.open_store(path)
+        title = f"{header['label']} Representation (n={header['n']})"
+        for gen in range(store.shape[1]):
+            points = np.array(store[run, gen])      # One generation off the memory map
+            if np.isnan(points).any():
+                return          # Run stopped (or was never written) here
+            yield title, gen, points
+        return
+
+    label = _text_title(path)
+    for gen, points in trajectory.read_log(path):
+        yield f"{label} (n={len(points)})", gen, points
+
+# ===================== FIGURE =====================
+class AnimationFigure(plotting.DistributionFigure):
+    """
+    The final-distribution plot with animated points and generation counter.
+    Everything else is drawn once and restored for each frame
+    """
+    def __init__(self, dpi):
+        super().__init__()
+        self.fig.set_dpi(dpi)
+        self.points.set_animated(True)
+        self.counter = self.ax.text(0.02, 0.98, '', transform=self.ax.transAxes,
+                                    fontsize=11, va='top', animated=True)
+        self.background = None
+
+    def start(self, title):
+        """Draws the static parts and keeps them as the frame background"""
+        self.title.set_text(title)
+        self.fig.tight_layout()
+        self.fig.canvas.draw()
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+
+    def frame(self, gen, points):
+        """RGBA array of the figure showing this generation"""
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)
+        self.points.set_offsets(points)
+        self.counter.set_text(f'Gen {gen}')
+        self.ax.draw_artist(self.points)
+        self.ax.draw_artist(self.counter)
+        return np.asarray(canvas.buffer_rgba())
+
+# ===================== WRITERS =====================
+class GifWriter:
+    """
+    Appends frames to a looping GIF as they come. All frames share the
+    palette of the first one
+    """
+    def __init__(self, path, fps):
+        self.file = open(path, 'wb')
+        self.duration = round(1000 / fps)   # Milliseconds per frame
+        self.palette = None
+
+    def write(self, rgba):
+        from PIL import GifImagePlugin, Image
+
+        rgb = Image.fromarray(rgba).convert("RGB")
+        if self.palette is None:
+            self.palette = rgb.quantize(colors=256)
+            header, _ = GifImagePlugin.getheader(self.palette.copy(), info={"loop": 0, "optimize": False})
+            self.file.write(b"".join(header))
+
+        indexed = rgb.quantize(palette=self.palette, dither=Image.Dither.NONE)
+        for chunk in GifImagePlugin.getdata(indexed, duration=self.duration):
+            self.file.write(chunk)
+
+    def close(self):
+        self.file.write(b";")               # GIF trailer
+        self.file.close()
+
+class Mp4Writer:
+    """Pipes raw RGBA frames to ffmpeg (H.264, padded to even dimensions)"""
+    def __init__(self, path, fps):
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("MP4 output needs ffmpeg on the PATH; use a .gif output instead")
+        self.path, self.fps, self.ffmpeg = path, fps, ffmpeg
+        self.proc = None
+
+    def write(self, rgba):
+        if self.proc is None:
+            height, width = rgba.shape[:2]
+            self.proc = subprocess.Popen(
+                [self.ffmpeg, "-y", "-loglevel", "error",
+                 "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+                 "-r", str(self.fps), "-i", "-",
+                 "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                 "-c:v", "libx264", "-pix_fmt", "yuv420p", self.path],
+                stdin=subprocess.PIPE)
+        self.proc.stdin.write(rgba.tobytes())
+
+    def close(self):
+        if self.proc is None:
+            return
+        self.proc.stdin.close()
+        if self.proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed writing {self.path}")
+
+WRITERS = {
+    ".gif": GifWriter,
+    ".mp4": Mp4Writer,
+}
+
+# ===================== EXPORT =====================
+def export_animation(path, out_path, run=-1, fps=20, every=1, dpi=100):
+    """
+    Writes the run in `path` (text log or .npy store) as an animation; the
+    format follows out_path's extension. Returns the number of frames
+    """
+    ext = os.path.splitext(out_path)[1].lower()
+    if ext not in WRITERS:
+        raise ValueError(f"Unsupported animation format '{ext}' (use {', '.join(WRITERS)})")
+
+    figure = AnimationFigure(dpi)
+    writer = WRITERS[ext](out_path, fps)
+    frames = 0
+    last = None
+    try:
+        for title, gen, points in iter_frames(path, run):
+            if figure.background is None:
+                figure.start(title)
+            last = (gen, points)
+            if gen % every:
+                continue
+            writer.write(figure.frame(gen, points))
+            frames += 1
+
+        # Always end on the final generation
+        if last is not None and last[0] % every:
+            writer.write(figure.frame(*last))
+            frames += 1
+    finally:
+        writer.close()
+
+    return frames
+
+def main():
+    parser = argparse.ArgumentParser(description='Animate the best individual of every generation')
+    parser.add_argument('log', help='Text log (full or compact) or .npy trajectory store')
+    parser.add_argument('--out', required=True, help='Output .gif or .mp4')
+    parser.add_argument('--run', type=int, default=-1,
+                        help='Run of a .npy store to animate (default: -1, the last)')
+    parser.add_argument('--fps', type=int, default=20, help='Frames per second (default: 20)')
+    parser.add_argument('--every', type=int, default=1,
+                        help='Use every K-th generation as a frame (default: 1)')
+    parser.add_argument('--dpi', type=int, default=100,
+                        help='Frame resolution; frames are 6x6 inches (default: 100)')
+    args = parser.parse_args()
+
+    frames = export_animation(args.log, args.out, args.run, args.fps, args.every, args.dpi)
+    print(f"{args.out}: {frames} frames")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+This is the array-backed population used by the Point-Scattering
+Problem implementations when run with --engine array.
+
+Instead of DEAP individuals (lists of tuples), the whole population is one
+contiguous (pop, n, 2) NumPy array with a parallel fitness array.
+Selection and cloning are index operations, crossover and mutation apply
+random masks to the whole offspring batch at once, and the offspring are written into a second buffer that
+is swapped with the population every generation, so the evolution loop
+does not allocate new individuals.
+
+With --engine lockstep, run_experiment evolves all of its runs together in
+one (runs, pop, n, 2) array (run_lockstep). Every run keeps its own
+RandomState and draws from it in the same order as run_single_array, so
+each seed gives exactly the --engine array result, while cloning,
+variation and evaluation are single NumPy operations over all runs.
+"""
+# Standard libraries or third-party packages
+import copy
+import functools
+import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+# Local Imports
+import background
+import evaluators
+import profiling
+import trajectory
+import utility
+
+# ===================== REPRESENTATION =====================
+@dataclass(frozen=True)
+class Representation:
+    """What the array engine needs to know about a representation"""
+    name: str                   # Used for the log file name
+    label: str                  # Used for the log header
+    sample_points: Callable     # (rng, size) -> (size, 2) array of new genes
+    polar: bool = False         # Genes are (r, theta) and need converting for logs
+    trig_cache: bool = False    # Keep (cos, sin) per gene for the evaluator
+
+# ===================== POPULATION STORE =====================
+class ArrayPopulation:
+    """
+    points: (pop, n, 2) genes of every individual
+    fitness: (pop,) min distance of every individual
+    valid: (pop,) False where the fitness must be recomputed
+    unit: (pop, n, 2) cached (cos theta, sin theta) of polar genes, else None
+    """
+    def __init__(self, points, trig_cache=False):
+        self.points = points
+        self.fitness = np.zeros(len(points))
+        self.valid = np.zeros(len(points), dtype=bool)
+        self.unit = utility.polar_unit_vectors_array(points) if trig_cache else None
+
+    def __len__(self):
+        return len(self.points)
+
+    def evaluate(self, evaluate_batch, cache=None, start=0, stop=None):
+        """
+        Evaluates only the individuals with invalid fitness (skipping genomes
+        already in the optional FitnessCache), returns how many were evaluated.
+        start/stop limit it to those rows (one run of a lockstep population)
+        """
+        invalid = start + np.flatnonzero(~self.valid[start:stop])
+        if len(invalid) == 0:
+            return 0
+
+        def evaluate(rows):
+            rows = invalid[rows]
+            if self.unit is not None:
+                return evaluate_batch(self.points[rows], self.unit[rows])
+            return evaluate_batch(self.points[rows])
+
+        if cache is not None:
+            fitness, n_evals = utility.evaluate_with_cache(self.points[invalid], evaluate, cache)
+        else:
+            fitness, n_evals = evaluate(np.arange(len(invalid))), len(invalid)
+
+        self.fitness[invalid] = fitness
+        self.valid[invalid] = True
+        return n_evals
+
+    def take(self, indices, out):
+        """
+        Clones the individuals at indices into the population out, reusing
+        its buffers (the array equivalent of map(toolbox.clone, ...))
+        """
+        np.take(self.points, indices, axis=0, out=out.points)
+        np.take(self.fitness, indices, out=out.fitness)
+        np.take(self.valid, indices, out=out.valid)
+        if self.unit is not None:
+            np.take(self.unit, indices, axis=0, out=out.unit)
+        return out
+
+    def best(self):
+        """Index of the best individual"""
+        return int(np.argmax(self.fitness))
+
+    def subset(self, rows):
+        """A new population of the individuals at rows (dropping stopped lockstep runs)"""
+        out = ArrayPopulation(self.points[rows])
+        out.fitness = self.fitness[rows]
+        out.valid = self.valid[rows]
+        out.unit = self.unit[rows] if self.unit is not None else None
+        return out
+
+# ===================== OPERATORS =====================
+def sel_tournament(fitness, k, tournsize, rng):
+    """
+    Tournament selection on a fitness array, returns k winner indices.
+    All contestants are drawn in one call, the winner is the argmax
+    """
+    contestants = rng.randint(0, len(fitness), size=(k, tournsize))
+    winners = np.argmax(fitness[contestants], axis=1)
+    return contestants[np.arange(k), winners]
+
+def cx_uniform(pop, cxpb, rng, indpb=0.5):
+    """
+    Uniform crossover of consecutive pairs (0,1), (2,3), ... for the whole
+    batch at once: each pair mates with probability cxpb and then swaps
+    each point with probability indpb
+    """
+    mate, swap = cx_draw(len(pop) // 2, pop.points.shape[1], cxpb, indpb, rng)
+    arrays = [pop.points] if pop.unit is None else [pop.points, pop.unit]
+    cx_apply(arrays, pop.valid, mate, swap)
+
+def cx_draw(n_pairs, n, cxpb, indpb, rng):
+    """Random part of cx_uniform: which pairs mate, and which points they swap"""
+    mate = rng.random_sample(n_pairs) < cxpb
+    swap = (rng.random_sample((n_pairs, n)) < indpb) & mate[:, None]
+    return mate, swap
+
+def cx_apply(arrays, valid, mate, swap):
+    """
+    Swaps the drawn points of every pair. Arrays are (..., pop, n, 2) with
+    any leading axes (runs of a lockstep population), matched by mate and swap
+    """
+    n_pairs = mate.shape[-1]
+
+    # Swap through views of the first and second child of every pair
+    mask = swap[..., None]
+    for arr in arrays:
+        child1 = arr[..., 0:2*n_pairs:2, :, :]
+        child2 = arr[..., 1:2*n_pairs:2, :, :]
+        swapped = np.where(mask, child2, child1)
+        child2[...] = np.where(mask, child1, child2)
+        child1[...] = swapped
+
+    valid[..., 0:2*n_pairs:2][mate] = False
+    valid[..., 1:2*n_pairs:2][mate] = False
+
+def mutate(pop, mutpb, indpb, sample_points, rng):
+    """
+    Mutation of the whole batch at once: each individual mutates with
+    probability mutpb, each of its points is then replaced by a freshly
+    sampled one with probability indpb
+    """
+    mutants, genes, new_points = mutate_draw(len(pop), pop.points.shape[1], mutpb, indpb,
+                                             sample_points, rng)
+    mutate_apply(pop.points, pop.unit, pop.valid, mutants, genes, new_points)
+
+def mutate_draw(size, n, mutpb, indpb, sample_points, rng):
+    """Random part of mutate: mutants, their replaced genes and the new points"""
+    mutants = rng.random_sample(size) < mutpb
+    genes = (rng.random_sample((size, n)) < indpb) & mutants[:, None]
+    return mutants, genes, sample_points(rng, int(np.count_nonzero(genes)))
+
+def mutate_apply(points, unit, valid, mutants, genes, new_points):
+    """Writes the new points; new_points is in the C order of genes"""
+    points[genes] = new_points
+    valid[mutants] = False
+
+    # Only the mutated genes need their cos/sin refreshed
+    if unit is not None:
+        unit[genes] = utility.polar_unit_vectors_array(points[genes])
+
+# ===================== EVOLUTION =====================
+def run_single_array(args, rep: Representation) -> Dict[str, Any]:
+    """
+    Same GA and return value as the DEAP run_single of each implementation,
+    run on an ArrayPopulation
+    """
+    # Use Standard Config from Utitilty
+    cfg = utility.Config()
+
+    # Each run needs a unique seed
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+    rng = np.random.RandomState(args.seed)
+
+    dtype = np.float32 if getattr(args, "dtype", "float64") == "float32" else np.float64
+
+    # Per-phase timing (--profile) and stopping rules (--stall-window, --target, --time-budget)
+    prof = profiling.start(args)
+    stop = utility.EarlyStop(utility.StopRules.from_args(args))
+
+    # Create and evaluate initial population, plus the offspring buffer
+    points = rep.sample_points(rng, cfg.pop_size * args.n).reshape(cfg.pop_size, args.n, 2)
+    population = ArrayPopulation(points.astype(dtype), rep.trig_cache)
+    offspring = ArrayPopulation(np.zeros_like(population.points), rep.trig_cache)
+    fit_cache = utility.make_fitness_cache(args, polar=rep.polar)
+    evaluate_batch = evaluators.select(args, rep.name, rep.sample_points, deap=False).batch
+    evaluations = population.evaluate(evaluate_batch, fit_cache)
+
+    # Track Performance of Generations
+    best_by_gen: List[float] = []
+    avg_by_gen: List[float] = []
+
+    def record() -> None:
+        """ Records the best and avg pop fitness for this gen"""
+        best_by_gen.append(float(population.fitness[population.best()]))
+        avg_by_gen.append(float(np.mean(population.fitness)))
+
+    record()
+    stop.update(0, best_by_gen[-1], evaluations)
+
+    # Open generation log (text, or binary store with --log-format binary)
+    with trajectory.open_generation_log(args, rep.name, rep.label, cfg) as log_gen:
+        prof.lap("init")
+
+        # Evolution loop, until a stopping rule fires
+        for gen in range(cfg.generations):
+            if stop.reason is not None:
+                break
+
+            # Select and clone offspring
+            chosen = sel_tournament(population.fitness, len(population), cfg.tournsize, rng)
+            prof.lap("select")
+            population.take(chosen, offspring)
+            prof.lap("clone")
+
+            # Variation
+            cx_uniform(offspring, cfg.cxpb, rng)
+            prof.lap("crossover")
+            mutate(offspring, cfg.mutpb, args.indpb, rep.sample_points, rng)
+            prof.lap("mutation")
+
+            # Evaluate individuals with invalid fitness
+            evaluations += offspring.evaluate(evaluate_batch, fit_cache)
+            prof.lap("evaluate")
+
+            # Replace population, the old one becomes the next buffer
+            population, offspring = offspring, population
+
+            # Record performance
+            record()
+            stop.update(gen + 1, best_by_gen[-1], evaluations)
+            prof.lap("best")
+
+            # Log this generation
+            best_ind = _to_points(population.points[population.best()], rep)
+            log_gen(gen, best_ind)
+            prof.lap("log")
+
+    # Final best solution found in this run
+    best = population.best()
+
+    return utility.run_result(best_by_gen, avg_by_gen, [tuple(map(float, p)) for p in population.points[best]],
+                              float(population.fitness[best]), evaluations, fit_cache,
+                              stop, prof.result(stop.generations, evaluations), cfg)
+
+# ===================== LOCKSTEP RUNS =====================
+def run_lockstep(args, rep: Representation, seeds):
+    """
+    Drop-in for utility.run_seeds(run_single, args, seeds) under
+    --engine lockstep: yields one run_single_array result per seed, in seed
+    order. With --workers N the seeds are split into N blocks, each evolved
+    in lockstep in its own process
+    """
+    workers = getattr(args, "workers", 1) or 1
+    if workers <= 1 or len(seeds) <= 1:
+        yield from _lockstep_block(args, rep, seeds[-1], seeds)
+        args.seed = seeds[-1]
+        return
+
+    blocks = [list(block) for block in np.array_split(seeds, min(workers, len(seeds)))]
+    block_args = [copy.copy(args) for _ in blocks]
+
+    background.flush()      # No forking while the writer thread is mid-job
+    with ProcessPoolExecutor(max_workers=len(blocks)) as executor:
+        run_block = functools.partial(_lockstep_worker, rep=rep, last_seed=seeds[-1])
+        for results in executor.map(run_block, block_args, blocks):
+            yield from results
+
+    args.seed = seeds[-1]
+
+def _lockstep_worker(args, seeds, rep, last_seed):
+    """Pool worker: a block of runs plus its queued background I/O"""
+    results = list(_lockstep_block(args, rep, last_seed, seeds))
+    background.flush()
+    return results
+
+def _lockstep_block(args, rep, last_seed, seeds):
+    """Evolves the runs of seeds together and returns their results"""
+    cfg = utility.Config()
+    runs, pop_size, n = len(seeds), cfg.pop_size, args.n
+    rngs = [np.random.RandomState(seed) for seed in seeds]
+
+    dtype = np.float32 if getattr(args, "dtype", "float64") == "float32" else np.float64
+
+    # Per-phase timing of the whole block (--profile) and each run's stopping rules.
+    # All runs share the block's wall clock, so their time-to-target seconds are
+    # block time and a per-run --time-budget cannot be kept
+    rules = utility.StopRules.from_args(args)
+    if rules.time_budget is not None:
+        raise ValueError("--time-budget is per run and cannot be used with --engine lockstep, "
+                         "whose runs share one clock; use --engine array")
+    prof = profiling.start(args)
+    stops = [utility.EarlyStop(rules) for _ in seeds]
+
+    # All runs in one (runs * pop) population; the 4-D views index by run.
+    # Runs that stop are dropped from it, active holds the runs still in it
+    points = np.concatenate([rep.sample_points(rng, pop_size * n).reshape(pop_size, n, 2)
+                             for rng in rngs])
+    population = ArrayPopulation(points.astype(dtype), rep.trig_cache)
+    offspring = ArrayPopulation(np.zeros_like(population.points), rep.trig_cache)
+    fit_caches = [utility.make_fitness_cache(args, polar=rep.polar) for _ in seeds]
+    evaluate_batch = evaluators.select(args, rep.name, rep.sample_points, deap=False).batch
+    active = np.arange(runs)
+
+    evaluations = np.zeros(runs, dtype=int)     # Fitness evaluations of each run
+
+    def evaluate(pop):
+        if fit_caches[0] is None:
+            evaluations[active] += np.count_nonzero(~pop.valid.reshape(len(active), pop_size), axis=1)
+            pop.evaluate(evaluate_batch)
+            return
+        for k, run in enumerate(active):   # Each run has its own cache
+            evaluations[run] += pop.evaluate(evaluate_batch, fit_caches[run], k * pop_size, (k + 1) * pop_size)
+
+    evaluate(population)
+
+    # Track Performance of Generations, per run
+    best_by_gen = [[] for _ in seeds]
+    avg_by_gen = [[] for _ in seeds]
+
+    def record(fitness) -> None:
+        for run, best, avg in zip(active, fitness.max(axis=1), fitness.mean(axis=1)):
+            best_by_gen[run].append(float(best))
+            avg_by_gen[run].append(float(avg))
+
+    # Best individual and fitness of each run, kept when it stops
+    final = {}
+
+    def check_stops(generation):
+        """Freezes the runs whose stopping rule fires; returns which active runs go on"""
+        best = population.fitness.reshape(len(active), pop_size).argmax(axis=1)
+        going = np.ones(len(active), dtype=bool)
+        for k, run in enumerate(active):
+            if stops[run].update(generation, best_by_gen[run][-1], evaluations[run]):
+                going[k] = False
+                row = k * pop_size + best[k]
+                final[run] = ([tuple(map(float, p)) for p in population.points[row]],
+                              float(population.fitness[row]))
+        return going
+
+    record(population.fitness.reshape(runs, pop_size))
+    going = check_stops(0)
+
+    # Per-run arguments, as utility.run_seeds hands them to each run
+    run_args = []
+    for seed in seeds:
+        cur = copy.copy(args)
+        cur.seed = seed
+        cur.write_log = seed == last_seed
+        run_args.append(cur)
+
+    with ExitStack() as stack:
+        # Text logs only keep the last run; the binary store keeps them all
+        loggers = {run: stack.enter_context(trajectory.open_generation_log(cur, rep.name, rep.label, cfg))
+                   for run, cur in enumerate(run_args)
+                   if cur.write_log or getattr(args, "log_format", "text") == "binary"}
+
+        prof.lap("init")
+
+        # Evolution loop, until every run has stopped
+        for gen in range(cfg.generations):
+            # Stopped runs leave the population, so they cost no more work
+            if not going.all():
+                rows = np.flatnonzero(np.repeat(going, pop_size))
+                population, offspring = population.subset(rows), offspring.subset(rows)
+                active = active[going]
+            if len(active) == 0:
+                break
+            live = len(active)
+
+            # Select and clone offspring, each run from its own population
+            fitness = population.fitness.reshape(live, pop_size)
+            chosen = np.concatenate([k * pop_size + sel_tournament(fitness[k], pop_size, cfg.tournsize, rngs[run])
+                                     for k, run in enumerate(active)])
+            prof.lap("select")
+            population.take(chosen, offspring)
+            prof.lap("clone")
+
+            # Variation: per-run draws, applied to all runs at once
+            cx = [cx_draw(pop_size // 2, n, cfg.cxpb, 0.5, rngs[run]) for run in active]
+            arrays = [offspring.points.reshape(live, pop_size, n, 2)]
+            if offspring.unit is not None:
+                arrays.append(offspring.unit.reshape(live, pop_size, n, 2))
+            cx_apply(arrays, offspring.valid.reshape(live, pop_size),
+                     np.stack([mate for mate, _ in cx]), np.stack([swap for _, swap in cx]))
+            prof.lap("crossover")
+
+            mut = [mutate_draw(pop_size, n, cfg.mutpb, args.indpb, rep.sample_points, rngs[run]) for run in active]
+            mutate_apply(offspring.points, offspring.unit, offspring.valid,
+                         np.concatenate([mutants for mutants, _, _ in mut]),
+                         np.concatenate([genes for _, genes, _ in mut]),
+                         np.concatenate([new_points for _, _, new_points in mut]))
+            prof.lap("mutation")
+
+            # Evaluate individuals with invalid fitness
+            evaluate(offspring)
+            prof.lap("evaluate")
+
+            # Replace population, the old one becomes the next buffer
+            population, offspring = offspring, population
+
+            # Record performance
+            fitness = population.fitness.reshape(live, pop_size)
+            record(fitness)
+            prof.lap("best")
+
+            # Log this generation
+            best = fitness.argmax(axis=1)
+            for k, run in enumerate(active):
+                if run in loggers:
+                    loggers[run](gen, _to_points(population.points[k * pop_size + best[k]], rep))
+            prof.lap("log")
+
+            going = check_stops(gen + 1)
+
+    # Final best solution found in each run (runs still going stop here)
+    best = population.fitness.reshape(len(active), pop_size).argmax(axis=1)
+    for k, run in enumerate(active):
+        if run not in final:
+            row = k * pop_size + best[k]
+            final[run] = ([tuple(map(float, p)) for p in population.points[row]], float(population.fitness[row]))
+    block_profile = prof.result(max(stop.generations for stop in stops), int(evaluations.sum()))
+
+    return [utility.run_result(best_by_gen[run], avg_by_gen[run], final[run][0], final[run][1],
+                               int(evaluations[run]), fit_caches[run], stops[run],
+                               profiling.share(block_profile, runs, stops[run].generations, int(evaluations[run])),
+                               cfg)
+            for run in range(runs)]
+
+def _to_points(genes, rep):
+    """Genes of one individual as the (n, 2) X,Y points written to the logs"""
+    if rep.polar:
+        r, theta = genes[:, 0], genes[:, 1]
+        return np.column_stack((r * np.cos(theta), r * np.sin(theta)))
+    return genes
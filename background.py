@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+This is the background I/O writer for the Point-Scattering Problem
+implementations (--background-io).
+
+Generation log records and plot jobs are queued to a single writer thread
+instead of running inside the evolution loop, so the next run (or the next
+representation) computes while the previous one's files are written.
+Jobs run in submission order. A failing job does not stop the others; its
+error is raised in the caller on the next submit(), flush() or shutdown().
+Flush before forking worker processes: a fork taken while the thread is
+mid-job can copy a held lock into the child.
+"""
+# Standard libraries or third-party packages
+import atexit
+import os
+import queue
+import threading
+import traceback
+
+class BackgroundWriter:
+    """One thread running queued jobs in order"""
+    def __init__(self, maxsize=4096):
+        # Bounded so a slow disk pushes back instead of growing memory
+        self._queue = queue.Queue(maxsize)
+        self._error = None
+        self._thread = threading.Thread(target=self._loop, name="background-io", daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                fn, args, kwargs = job
+                fn(*args, **kwargs)
+            except BaseException as exc:
+                if self._error is None:     # Keep the first failure
+                    self._error = (exc, traceback.format_exc())
+            finally:
+                self._queue.task_done()
+
+    def check(self):
+        """Raises the first error a job hit since the last check"""
+        if self._error is not None:
+            exc, trace = self._error
+            self._error = None
+            raise RuntimeError(f"Background I/O job failed:\n{trace}") from exc
+
+    def submit(self, fn, *args, **kwargs):
+        self.check()
+        self._queue.put((fn, args, kwargs))
+
+    def flush(self):
+        """Waits until every queued job has run"""
+        self._queue.join()
+        self.check()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        self.check()
+
+# ===================== PROCESS-WIDE WRITER =====================
+_writer = None
+
+def get_writer():
+    """The writer of this process, started on first use"""
+    global _writer
+    if _writer is None:
+        _writer = BackgroundWriter()
+    return _writer
+
+def enabled(args):
+    return getattr(args, "background_io", False)
+
+def call(args, fn, *fn_args, **fn_kwargs):
+    """Runs fn on the writer thread with --background-io, else right away"""
+    if enabled(args):
+        get_writer().submit(fn, *fn_args, **fn_kwargs)
+    else:
+        fn(*fn_args, **fn_kwargs)
+
+def flush():
+    """Waits for the queued jobs (if any) and raises their first error"""
+    if _writer is not None:
+        _writer.flush()
+
+def shutdown():
+    """Flushes and stops the writer; raises the first error of its jobs"""
+    global _writer
+    writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
+
+def _forget_in_child():
+    """A forked child has no writer thread: start its own on first use"""
+    global _writer
+    _writer = None
+
+# Scripts that never call shutdown() still get their files written
+atexit.register(shutdown)
+os.register_at_fork(after_in_child=_forget_in_child)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the polar fitness with and without trigonometry in the pair loop.
+
+Compares, per individual:
+    calcMinEuclideanDistancePolar           - original, math.cos for every pair
+    calcMinEuclideanDistancePolarBatch      - NumPy, np.cos for every pair
+    calcMinEuclideanDistancePolarTrigBatch  - NumPy, cached (cos, sin) per gene, dot products only
+
+Run from the repository root:
+    python -m benchmarks.bench_polar_trig
+"""
+# Standard libraries or third-party packages
+import argparse
+import math
+import timeit
+import numpy as np
+
+# Local Imports
+import utility
+
+def time_per_call(fn, min_time=0.2):
+    """Seconds per call of fn, repeating until at least min_time has passed"""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+def main():
+    parser = argparse.ArgumentParser(description='Polar evaluator benchmark (trig vs cached sin/cos)')
+    parser.add_argument('--n', type=int, nargs='+', default=[5, 25, 100, 1000],
+                        help='Point counts to benchmark (default: 5 25 100 1000)')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='Random seed for the test individuals (default: 42)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+
+    print(f"{'n':>6} {'original':>12} {'np.cos':>12} {'cached':>12} {'speedup':>9}")
+    for n in args.n:
+        points = np.column_stack((rng.uniform(0, 1, n), rng.uniform(0, 2*math.pi, n)))
+        as_list = [tuple(p) for p in points]
+
+        # One individual per call; the cache is built once like after init
+        batch = points[None]
+        unit = utility.polar_unit_vectors_array(batch)
+
+        # Cross-check the three agree before timing them
+        expected = utility.calcMinEuclideanDistancePolar(as_list)[0]
+        assert abs(utility.calcMinEuclideanDistancePolarBatch(batch)[0] - expected) < 1e-9
+        assert abs(utility.calcMinEuclideanDistancePolarTrigBatch(batch, unit)[0] - expected) < 1e-9
+
+        t_orig = time_per_call(lambda: utility.calcMinEuclideanDistancePolar(as_list))
+        t_cos = time_per_call(lambda: utility.calcMinEuclideanDistancePolarBatch(batch))
+        t_cached = time_per_call(lambda: utility.calcMinEuclideanDistancePolarTrigBatch(batch, unit))
+
+        print(f"{n:>6} {t_orig*1e6:>10.1f}us {t_cos*1e6:>10.1f}us {t_cached*1e6:>10.1f}us {t_orig/t_cached:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
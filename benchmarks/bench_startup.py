@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Cold-start budget for the Point-Scattering Problem implementations.
+
+Imports main.py in fresh interpreters under `python -X importtime` and
+fails (exit status 1) when:
+    - the best of --repeat imports takes longer than --budget seconds, or
+    - a lazily loaded back-end (matplotlib, scipy.stats, scipy.spatial)
+      is imported before any evolution starts
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --budget 0.5 --repeat 5
+"""
+# Standard libraries or third-party packages
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# Only needed once a run plots, computes its CI or uses the KD-tree
+LAZY_MODULES = ("matplotlib", "scipy.stats", "scipy.spatial")
+
+# "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_profile(module="main"):
+    """
+    Imports module in a fresh interpreter.
+    Returns (seconds for the top-level import, {imported module: cumulative seconds})
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2)) / 1e6
+
+    return cumulative[module], cumulative
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold-start import budget check')
+    parser.add_argument('--budget', type=float, default=0.5,
+                        help='Maximum seconds to import main.py (default: 0.5)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Fresh interpreters to try; the fastest counts (default: 5)')
+    parser.add_argument('--top', type=int, default=10,
+                        help='Slowest imports to list (default: 10)')
+    args = parser.parse_args()
+
+    runs = [import_profile() for _ in range(args.repeat)]
+    best, cumulative = min(runs, key=lambda run: run[0])
+
+    print(f"import main: {best:.3f}s (best of {args.repeat}, budget {args.budget:.3f}s)")
+    print("Slowest imports (cumulative):")
+    for name, seconds in sorted(cumulative.items(), key=lambda kv: -kv[1])[1:args.top + 1]:
+        print(f"    {seconds:7.3f}s  {name}")
+
+    failures = []
+    if best > args.budget:
+        failures.append(f"import main took {best:.3f}s, over the {args.budget:.3f}s budget")
+    for lazy in LAZY_MODULES:
+        if lazy in cumulative:
+            failures.append(f"{lazy} is imported at startup ({cumulative[lazy]:.3f}s); import it on first use")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
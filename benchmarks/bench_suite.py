@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Point-Scattering Problem implementations.
+
+Areas (--areas, default all four):
+    fitness      every fitness function in utility.py across --n:
+                 evaluations/sec (individuals measured per second)
+    operators    init and mutate of each representation across --n:
+                 individuals/sec
+    run          one run_single per representation at a fixed seed:
+                 generations/sec and evaluations/sec
+    experiment   run_experiment per representation (--runs runs):
+                 generations/sec and evaluations/sec
+
+Every benchmark also records its peak traced memory (tracemalloc), in one
+extra untimed pass so tracing does not slow the timings. Runs and
+experiments write their logs and plots into a temporary directory.
+
+Results are saved as JSON, so two commits can be compared on one machine:
+    python -m benchmarks.bench_suite --out before.json
+    python -m benchmarks.bench_suite --compare before.json --tolerance 0.20
+With --compare the exit status is 1 when any throughput is more than
+--tolerance below the baseline's. Timings are the best of --repeat; on a
+shared or virtual machine expect 10-20% noise between identical runs.
+
+Run from the repository root:
+    python -m benchmarks.bench_suite --areas fitness operators --n 5 25
+"""
+# Standard libraries or third-party packages
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+import numpy as np
+
+# Local Imports
+import evaluators
+import utility
+from implementations import boundary, cartesian, polar
+
+AREAS = ("fitness", "operators", "run", "experiment")
+
+# Representation name -> (module, init, mutate, sample_points)
+REPRESENTATIONS = {
+    "cartesian": (cartesian, cartesian.init_cartesian_ind, cartesian.mutate_cartesian_ind,
+                  cartesian.sample_cartesian_points),
+    "polar": (polar, polar.init_polar_ind, polar.mutate_polar_ind, polar.sample_polar_points),
+    "boundary": (boundary, boundary.init_boundary_ind, boundary.mutate_boundary_ind,
+                 boundary.sample_boundary_points),
+}
+
+# utility.py fitness function -> (genes it takes, evaluates a whole population)
+FITNESS = {
+    "calcMinEuclideanDistance": ("cartesian", False),
+    "calcMinEuclideanDistanceIndexed": ("cartesian", False),
+    "calcMinEuclideanDistanceBatch": ("cartesian", True),
+    "calcMinEuclideanDistancePolar": ("polar", False),
+    "calcMinEuclideanDistancePolarIndexed": ("polar", False),
+    "calcMinEuclideanDistancePolarBatch": ("polar", True),
+    "calcMinEuclideanDistancePolarTrigBatch": ("polar", True),
+    "calcMinDistanceBoundary": ("boundary", False),
+    "calcMinDistanceBoundaryBatch": ("boundary", True),
+}
+
+# ===================== MEASURING =====================
+def time_per_call(fn, repeat):
+    """Seconds per call of fn: best of repeat autoranged timings"""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+def peak_memory_mb(fn):
+    """Peak memory traced while fn runs once, in MiB"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+def result(area, name, params, seconds, throughput, fn, memory=True):
+    return {
+        "area": area,
+        "name": name,
+        "params": params,
+        "seconds": seconds,
+        "throughput": throughput,       # {metric: per second}, higher is better
+        "peak_mb": peak_memory_mb(fn) if memory else None,
+    }
+
+@contextlib.contextmanager
+def scratch_directory():
+    """Runs inside an empty directory with logs/ and graphs/"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench_suite_") as tmp:
+        os.makedirs(os.path.join(tmp, "logs"))
+        os.makedirs(os.path.join(tmp, "graphs"))
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+
+# ===================== AREAS =====================
+def bench_fitness(args):
+    rng = np.random.RandomState(args.seed)
+    for n in args.n:
+        genes = {rep: sample(rng, args.pop * n).reshape(args.pop, n, 2)
+                 for rep, (_, _, _, sample) in REPRESENTATIONS.items()}
+        for name, (rep, batched) in FITNESS.items():
+            fn = getattr(utility, name)
+            if batched:
+                call, per_call = (lambda fn=fn, pts=genes[rep]: fn(pts)), args.pop
+            else:
+                ind = [tuple(p) for p in genes[rep][0].tolist()]
+                call, per_call = (lambda fn=fn, ind=ind: fn(ind)), 1
+
+            seconds = time_per_call(call, args.repeat)
+            yield result("fitness", name, {"n": n}, seconds,
+                         {"evals_per_sec": per_call / seconds}, call, args.memory)
+
+def bench_operators(args):
+    random.seed(args.seed)
+    for n in args.n:
+        for rep, (_, init, mutate, _) in REPRESENTATIONS.items():
+            seconds = time_per_call(lambda: init(n), args.repeat)
+            yield result("operators", init.__name__, {"n": n}, seconds,
+                         {"inds_per_sec": 1 / seconds}, lambda: init(n), args.memory)
+
+            ind = init(n)
+            seconds = time_per_call(lambda: mutate(ind, args.indpb), args.repeat)
+            yield result("operators", mutate.__name__, {"n": n, "indpb": args.indpb}, seconds,
+                         {"inds_per_sec": 1 / seconds}, lambda: mutate(ind, args.indpb), args.memory)
+
+def _run_args(args, n):
+    return argparse.Namespace(n=n, indpb=args.indpb, seed=args.seed, engine=args.engine,
+                              evaluator=args.evaluator, workers=1)
+
+def bench_run(args):
+    generations = utility.Config().generations
+    for n in args.n:
+        for rep, (module, _, _, _) in REPRESENTATIONS.items():
+            run_args = _run_args(args, n)
+            call = lambda: module.run_single(run_args)
+
+            best = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                run = call()
+                seconds = time.perf_counter() - start
+                best = seconds if best is None else min(best, seconds)
+
+            yield result("run", f"{rep}.run_single", {"n": n, "engine": args.engine}, best,
+                         {"gens_per_sec": generations / best,
+                          "evals_per_sec": run["evaluations"] / best}, call, args.memory)
+
+def bench_experiment(args):
+    generations = utility.Config().generations
+    for n in args.n:
+        for rep, (module, _, _, _) in REPRESENTATIONS.items():
+            run_args = _run_args(args, n)
+            call = lambda: module.run_experiment(run_args, n_runs=args.runs)
+
+            start = time.perf_counter()
+            experiment = call()
+            seconds = time.perf_counter() - start
+
+            yield result("experiment", f"{rep}.run_experiment",
+                         {"n": n, "engine": args.engine, "runs": args.runs}, seconds,
+                         {"gens_per_sec": args.runs * generations / seconds,
+                          "evals_per_sec": experiment["evaluations"] / seconds}, call, args.memory)
+
+BENCHMARKS = {
+    "fitness": bench_fitness,
+    "operators": bench_operators,
+    "run": bench_run,
+    "experiment": bench_experiment,
+}
+
+# ===================== COMPARING =====================
+def _key(entry):
+    params = ",".join(f"{k}={v}" for k, v in sorted(entry["params"].items()))
+    return f"{entry['area']}:{entry['name']}[{params}]"
+
+def compare(baseline, current, tolerance):
+    """
+    Prints the throughput ratio of every benchmark in both result sets.
+    Returns the regressions, those below 1 - tolerance of the baseline
+    """
+    if baseline["meta"].get("machine") != current["meta"].get("machine"):
+        print(f"Warning: baseline is from {baseline['meta'].get('machine')}, "
+              f"not this machine; ratios mix hardware with code changes")
+
+    old = {_key(entry): entry for entry in baseline["results"]}
+    regressions = []
+    print(f"\n{'benchmark':58s} {'metric':14s} {'ratio':>7s}")
+    for entry in current["results"]:
+        before = old.get(_key(entry))
+        if before is None:
+            continue
+        for metric, value in entry["throughput"].items():
+            if metric not in before["throughput"]:
+                continue
+            ratio = value / before["throughput"][metric]
+            flag = ""
+            if ratio < 1 - tolerance:
+                regressions.append(f"{_key(entry)} {metric}: {ratio:.2f}x of baseline")
+                flag = "  REGRESSION"
+            print(f"{_key(entry):58s} {metric:14s} {ratio:6.2f}x{flag}")
+    return regressions
+
+# ===================== MAIN =====================
+def git_commit():
+    """HEAD of the repository, with '+dirty' for uncommitted changes"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=root,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("+dirty" if dirty else "")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark suite with JSON output and regression check')
+    parser.add_argument('--areas', nargs='+', choices=AREAS, default=list(AREAS),
+                        help='Areas to benchmark (default: all)')
+    parser.add_argument('--n', type=int, nargs='+', default=[5, 25, 100],
+                        help='Point counts (default: 5 25 100)')
+    parser.add_argument('--pop', type=int, default=utility.Config().pop_size,
+                        help='Individuals per batched fitness call (default: the GA population)')
+    parser.add_argument('--indpb', type=float, default=0.2,
+                        help='Gene mutation probability (default: 0.2)')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='Seed of the test data and runs (default: 42)')
+    parser.add_argument('--engine', choices=['deap', 'array', 'lockstep'], default='deap',
+                        help='Engine for the run and experiment areas (default: deap)')
+    parser.add_argument('--evaluator', choices=['default', 'auto'] + evaluators.NAMES, default='default',
+                        help='Fitness back-end for the run and experiment areas (default: default)')
+    parser.add_argument('--runs', type=int, default=25,
+                        help='Runs per experiment (default: 25, as main.py)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Timings per benchmark (experiments: 1); the fastest counts (default: 5)')
+    parser.add_argument('--no-memory', dest='memory', action='store_false',
+                        help='Skip the extra pass measuring peak memory')
+    parser.add_argument('--out', default=None,
+                        help='Save the results to this JSON file')
+    parser.add_argument('--compare', default=None,
+                        help='Baseline JSON to check for throughput regressions')
+    parser.add_argument('--tolerance', type=float, default=0.20,
+                        help='Allowed throughput drop against --compare (default: 0.20)')
+    args = parser.parse_args()
+
+    current = {
+        "meta": {
+            "commit": git_commit(),
+            "machine": evaluators.machine_key(),
+            "python": platform.python_version(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "args": {k: v for k, v in vars(args).items() if k not in ("out", "compare")},
+        },
+        "results": [],
+    }
+
+    print(f"{'area':10s} {'benchmark':38s} {'params':24s} {'throughput':>28s} {'peak MiB':>9s}")
+    with scratch_directory():
+        for area in AREAS:
+            if area not in args.areas:
+                continue
+            for entry in BENCHMARKS[area](args):
+                current["results"].append(entry)
+                params = " ".join(f"{k}={v}" for k, v in entry["params"].items())
+                rates = " ".join(f"{v:,.0f} {k.replace('_per_sec', '/s')}" for k, v in entry["throughput"].items())
+                peak = f"{entry['peak_mb']:9.2f}" if entry["peak_mb"] is not None else f"{'-':>9s}"
+                print(f"{area:10s} {entry['name']:38s} {params:24s} {rates:>28s} {peak}")
+                sys.stdout.flush()
+
+    if args.out:
+        with open(args.out, "w") as out_file:
+            json.dump(current, out_file, indent=1)
+        print(f"\nSaved {args.out}")
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(baseline, current, args.tolerance)
+        for regression in regressions:
+            print(f"FAIL: {regression}")
+        sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
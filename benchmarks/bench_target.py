@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Time-to-target benchmark for the Point-Scattering Problem implementations.
+
+For small n the best maximum minimum separation of n points in the unit
+disk is known, so instead of comparing final fitness this measures how fast
+each representation gets within a fraction --eps of the optimum: every run stops at
+the target (main.py's --target) and the wall-clock seconds, generations and
+fitness evaluations it took are recorded.
+
+    optimum   cartesian, polar   BEST_KNOWN[n] (table below)
+              boundary           2*sin(pi/n), the regular n-gon; the points
+                                 are confined to the circle, so for n >= 7
+                                 this is below the disk optimum
+    target    optimum * (1 - eps), the same relative gap for every n
+
+Per representation, n and --indpb it reports the hits out of --runs, the
+median generations, evaluations and seconds of the hits, and the expected
+running time (ERT): everything spent over all runs, misses included, per
+hit. ERT is the number to minimise when tuning Config or --indpb, since it
+charges a setting both for being slow and for missing.
+
+    python -m benchmarks.bench_target --n 5 8 10 --indpb 0.1 0.2 0.3
+    python -m benchmarks.bench_target --reps polar --n 12 --eps 0.02 --out target.json
+
+Runs write their logs into a temporary directory.
+"""
+# Standard libraries or third-party packages
+import argparse
+import datetime
+import json
+import math
+import platform
+import sys
+import time
+from dataclasses import asdict
+import numpy as np
+
+# Local Imports
+import evaluators
+import utility
+from benchmarks.bench_suite import git_commit, scratch_directory
+from implementations import boundary, cartesian, polar
+
+REPRESENTATIONS = {
+    "cartesian": cartesian,
+    "polar": polar,
+    "boundary": boundary,
+}
+
+# Best-known maximum minimum separation of n points in the unit disk,
+# equivalently d = 2r / (1 - r) for the best-known packing of n equal
+# circles of radius r in a unit circle. Proven optimal for n <= 13 and n = 19
+BEST_KNOWN = {
+    2: 2.0,
+    3: math.sqrt(3),                # Equilateral triangle on the circle
+    4: math.sqrt(2),                # Square
+    5: 2 * math.sin(math.pi / 5),   # Regular pentagon
+    6: 1.0,                         # Regular hexagon (or pentagon + centre)
+    7: 1.0,                         # Hexagon + centre
+    8: 2 * math.sin(math.pi / 7),   # Heptagon + centre
+    9: 2 * math.sin(math.pi / 8),   # Octagon + centre
+    10: 0.7109782356,
+    11: 0.6840402867,
+    12: 0.6601527350,
+    13: (math.sqrt(5) - 1) / 2,
+    14: 0.6008841611,
+    15: 0.5679628677,
+    16: 0.5531852191,
+    17: 0.5274214664,
+    18: 2 * math.sin(math.pi / 12),
+    19: 2 * math.sin(math.pi / 12),
+    20: 0.4851636075,
+}
+
+def optimum(rep, n):
+    """Best-known fitness reachable by representation rep with n points"""
+    if rep == "boundary":
+        return 2 * math.sin(math.pi / n)
+    return BEST_KNOWN[n]
+
+# ===================== MEASURING =====================
+def run_to_target(module, args, n, indpb, target, seed):
+    """
+    One run stopped at target. Returns what it spent before the hit (or in
+    total on a miss) and whether it hit
+    """
+    run_args = argparse.Namespace(n=n, indpb=indpb, seed=seed, engine=args.engine,
+                                  evaluator=args.evaluator, workers=1,
+                                  target=target, time_budget=args.time_budget)
+    start = time.perf_counter()
+    run = module.run_single(run_args)
+    seconds = time.perf_counter() - start
+
+    hit = run["time_to_target"]
+    if hit is not None:
+        return {"hit": True, "generations": hit["generation"], "evaluations": hit["evaluations"],
+                "seconds": hit["seconds"], "best": run["best_overall_fitness"]}
+    return {"hit": False, "generations": run["generations"], "evaluations": run["evaluations"],
+            "seconds": seconds, "best": run["best_overall_fitness"]}
+
+def summarize(runs):
+    """Hits, medians over the hits and ERT over all runs"""
+    hits = [run for run in runs if run["hit"]]
+
+    def median(key):
+        return float(np.median([run[key] for run in hits])) if hits else None
+
+    def ert(key):
+        return sum(run[key] for run in runs) / len(hits) if hits else None
+
+    return {
+        "runs": len(runs),
+        "hits": len(hits),
+        "generations": median("generations"),
+        "evaluations": median("evaluations"),
+        "seconds": median("seconds"),
+        "ert_evaluations": ert("evaluations"),
+        "ert_seconds": ert("seconds"),
+        "best_fitness": max(run["best"] for run in runs),
+    }
+
+def bench(args):
+    for n in args.n:
+        for rep in args.reps:
+            opt = optimum(rep, n)
+            target = opt * (1 - args.eps)
+            for indpb in args.indpb:
+                runs = [run_to_target(REPRESENTATIONS[rep], args, n, indpb, target, args.seed + i)
+                        for i in range(args.runs)]
+                yield {"rep": rep, "n": n, "indpb": indpb, "optimum": opt, "target": target,
+                       **summarize(runs)}
+
+# ===================== REPORT =====================
+def _fmt(value, spec):
+    return f"{value:{spec}}" if value is not None else f"{'-':>{spec.split('.')[0]}}"
+
+def format_row(entry):
+    return (f"{entry['rep']:10s} {entry['n']:3d} {entry['optimum']:9.6f} {entry['indpb']:6.2f} "
+            f"{entry['hits']:3d}/{entry['runs']:<3d} {_fmt(entry['generations'], '6.0f')} "
+            f"{_fmt(entry['evaluations'], '8.0f')} {_fmt(entry['seconds'], '8.3f')} "
+            f"{_fmt(entry['ert_evaluations'], '9.0f')} {_fmt(entry['ert_seconds'], '8.3f')} "
+            f"{entry['best_fitness']:9.6f}")
+
+def best_settings(results):
+    """The --indpb with the lowest ERT seconds for each representation and n"""
+    best = {}
+    for entry in results:
+        if entry["ert_seconds"] is None:
+            continue
+        key = (entry["rep"], entry["n"])
+        if key not in best or entry["ert_seconds"] < best[key]["ert_seconds"]:
+            best[key] = entry
+    return best
+
+# ===================== MAIN =====================
+def main():
+    parser = argparse.ArgumentParser(description='Time and evaluations to reach the known optimum')
+    parser.add_argument('--reps', nargs='+', choices=list(REPRESENTATIONS), default=list(REPRESENTATIONS),
+                        help='Representations to benchmark (default: all)')
+    parser.add_argument('--n', type=int, nargs='+', default=[3, 5, 8, 10],
+                        help=f'Point counts, {min(BEST_KNOWN)} to {max(BEST_KNOWN)} (default: 3 5 8 10)')
+    parser.add_argument('--eps', type=float, default=0.05,
+                        help='Fraction below the optimum that counts as reaching it (default: 0.05)')
+    parser.add_argument('--indpb', type=float, nargs='+', default=[0.2],
+                        help='Gene mutation probabilities to compare (default: 0.2)')
+    parser.add_argument('--runs', type=int, default=10,
+                        help='Runs per setting (default: 10)')
+    parser.add_argument('--seed', type=int, default=12345,
+                        help='Seed of the first run, then +1 per run (default: 12345, as main.py)')
+    parser.add_argument('--engine', choices=['deap', 'array'], default='deap',
+                        help='Engine (default: deap)')
+    parser.add_argument('--evaluator', choices=['default', 'auto'] + evaluators.NAMES, default='default',
+                        help='Fitness back-end (default: default)')
+    parser.add_argument('--time-budget', type=float, default=None,
+                        help='Wall-clock seconds per run before it counts as a miss (default: none)')
+    parser.add_argument('--out', default=None,
+                        help='Save the results to this JSON file')
+    args = parser.parse_args()
+
+    unknown = [n for n in args.n if n not in BEST_KNOWN]
+    if unknown:
+        parser.error(f"no reference optimum for n = {', '.join(map(str, unknown))} "
+                     f"(known: {min(BEST_KNOWN)} to {max(BEST_KNOWN)})")
+
+    current = {
+        "meta": {
+            "commit": git_commit(),
+            "machine": evaluators.machine_key(),
+            "python": platform.python_version(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "config": asdict(utility.Config()),
+            "args": {k: v for k, v in vars(args).items() if k != "out"},
+        },
+        "results": [],
+    }
+
+    print(f"Target: optimum * (1 - {args.eps}), at most {utility.Config().generations} generations per run")
+    print(f"{'rep':10s} {'n':>3s} {'optimum':>9s} {'indpb':>6s} {'hits':>7s} {'gens':>6s} "
+          f"{'evals':>8s} {'seconds':>8s} {'ERT evals':>9s} {'ERT s':>8s} {'best':>9s}")
+    with scratch_directory():
+        for entry in bench(args):
+            current["results"].append(entry)
+            print(format_row(entry))
+            sys.stdout.flush()
+
+    best = best_settings(current["results"])
+    if len(args.indpb) > 1 and best:
+        print("\nLowest ERT seconds:")
+        for (rep, n), entry in best.items():
+            print(f"  {rep:10s} n={n:<3d} --indpb {entry['indpb']:.2f}  "
+                  f"({entry['ert_seconds']:.3f}s, {entry['ert_evaluations']:.0f} evaluations)")
+
+    if args.out:
+        with open(args.out, "w") as out_file:
+            json.dump(current, out_file, indent=1)
+        print(f"\nSaved {args.out}")
+
+if __name__ == "__main__":
+    main()
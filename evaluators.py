@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+This is the fitness back-end registry for the Point-Scattering Problem
+implementations (--evaluator).
+
+Every representation can be evaluated by several interchangeable back-ends,
+all computing the same minimum pairwise distance:
+    python        the original pure-Python pair loops
+    numpy         the batched NumPy pair pass over the whole population
+    trig          (polar genes) the pair pass on cached cos/sin per gene
+    sorted        (boundary genes) neighbouring angles after a sort
+    kdtree        a KD-tree per individual, measuring only candidate pairs
+    incremental   (DEAP engine) children re-measured from their parent's
+                  nearest-neighbour cache from n = 150 on
+    jit           a Numba-compiled pair loop, when numba is installed
+
+--evaluator default keeps each representation's usual choice. With
+--evaluator auto a short micro-benchmark times every available back-end on
+a random population of the run's size and the fastest is used. Results are
+cached per machine, keyed by representation, n and population size, in
+~/.cache/point-scattering/evaluators.json (or $XDG_CACHE_HOME), so only the
+first run of a configuration pays for the calibration.
+
+    python evaluators.py --rep polar --n 100        # Show the calibration
+    python evaluators.py --rep boundary --n 25 --force
+"""
+# Standard libraries or third-party packages
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import tempfile
+import time
+import numpy as np
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Callable, Optional
+
+# Local Imports
+import utility
+
+# ===================== BACK-ENDS =====================
+@dataclass(frozen=True)
+class Backend:
+    name: str
+    batch: Callable                 # (individuals, n, 2) genes [, cos/sin per gene] -> (individuals,)
+    incremental: bool = False       # DEAP engine may use the NeighbourCache path instead
+    requires: Optional[str] = None  # Optional package the back-end needs
+
+    def available(self):
+        return self.requires is None or importlib.util.find_spec(self.requires) is not None
+
+def _per_individual(evaluate):
+    """Batch wrapper for the one-individual evaluators (fitness tuples)"""
+    def batch(points_batch, unit_batch=None):
+        return np.array([evaluate(ind)[0] for ind in np.asarray(points_batch, dtype=float).tolist()])
+    return batch
+
+def _pairs(evaluate_batch):
+    """The batched pair pass, without its spatial-index switch for large n"""
+    def batch(points_batch, unit_batch=None):
+        return evaluate_batch(points_batch, spatial_index=False)
+    return batch
+
+def _trig_pairs(points_batch, unit_batch=None):
+    return utility.calcMinEuclideanDistancePolarTrigBatch(points_batch, unit_batch, spatial_index=False)
+
+def _keep_dispatch(evaluate_batch):
+    """The usual batched evaluator (pair pass, KD-tree from n = 128 on)"""
+    def batch(points_batch, unit_batch=None):
+        return evaluate_batch(points_batch)
+    return batch
+
+# ----- Numba kernel, compiled on first use -----
+_jit_kernel = None
+
+def _jit_min_distance(xy):
+    """Min pair distance of each (n, 2) X,Y individual with a compiled loop"""
+    global _jit_kernel
+    if _jit_kernel is None:
+        import numba
+
+        @numba.njit
+        def kernel(xy):
+            out = np.empty(xy.shape[0])
+            for k in range(xy.shape[0]):
+                best = np.inf
+                for i in range(xy.shape[1]):
+                    for j in range(i + 1, xy.shape[1]):
+                        dx = xy[k, i, 0] - xy[k, j, 0]
+                        dy = xy[k, i, 1] - xy[k, j, 1]
+                        d2 = dx*dx + dy*dy
+                        if d2 < best:
+                            best = d2
+                out[k] = np.sqrt(best)
+            return out
+
+        _jit_kernel = kernel
+    return _jit_kernel(np.ascontiguousarray(xy, dtype=np.float64))
+
+def _jit_cartesian(points_batch, unit_batch=None):
+    return _jit_min_distance(points_batch)
+
+def _jit_polar(points_batch, unit_batch=None):
+    pts = np.asarray(points_batch, dtype=np.float64)
+    if unit_batch is None:
+        unit_batch = utility.polar_unit_vectors_array(pts)
+    return _jit_min_distance(pts[..., :1] * unit_batch)
+
+def _backends(*backends):
+    return {backend.name: backend for backend in backends}
+
+# Representation name -> {back-end name: Backend}
+BACKENDS = {
+    "cartesian": _backends(
+        Backend("numpy", _pairs(utility.calcMinEuclideanDistanceBatch)),
+        Backend("kdtree", _per_individual(utility.calcMinEuclideanDistanceIndexed)),
+        Backend("incremental", _keep_dispatch(utility.calcMinEuclideanDistanceBatch), incremental=True),
+        Backend("jit", _jit_cartesian, requires="numba"),
+        Backend("python", _per_individual(utility.calcMinEuclideanDistance)),
+    ),
+    "polar": _backends(
+        Backend("trig", _trig_pairs),
+        Backend("numpy", _pairs(utility.calcMinEuclideanDistancePolarBatch)),
+        Backend("kdtree", _per_individual(utility.calcMinEuclideanDistancePolarIndexed)),
+        Backend("incremental", utility.calcMinEuclideanDistancePolarTrigBatch, incremental=True),
+        Backend("jit", _jit_polar, requires="numba"),
+        Backend("python", _per_individual(utility.calcMinEuclideanDistancePolar)),
+    ),
+    "boundary": _backends(
+        Backend("sorted", utility.calcMinDistanceBoundaryBatch),
+        Backend("trig", _trig_pairs),
+        Backend("numpy", _pairs(utility.calcMinEuclideanDistancePolarBatch)),
+        Backend("kdtree", _per_individual(utility.calcMinEuclideanDistancePolarIndexed)),
+        Backend("jit", _jit_polar, requires="numba"),
+        Backend("python", _per_individual(utility.calcMinEuclideanDistancePolar)),
+    ),
+}
+
+# What each representation used before there was a choice
+DEFAULTS = {
+    "cartesian": "incremental",
+    "polar": "incremental",
+    "boundary": "sorted",
+}
+
+NAMES = sorted({name for backends in BACKENDS.values() for name in backends})
+
+# ===================== SELECTION =====================
+_selected = {}      # Calibrations done (or read) by this process
+_warned = set()
+
+def select(args, name, sample_points, deap=True):
+    """
+    The Backend --evaluator asks for, for representation `name`.
+    sample_points: (rng, size) -> genes, used to calibrate --evaluator auto
+    deap: for the DEAP engine, the only one with the incremental path
+    """
+    backends = BACKENDS[name]
+    choice = getattr(args, "evaluator", "default")
+
+    if choice == "auto":
+        pop_size, indpb = utility.Config().pop_size, getattr(args, "indpb", 0.2)
+        key = (name, args.n, pop_size, indpb, deap)
+        if key not in _selected:
+            _selected[key] = calibrated(name, args.n, pop_size, sample_points, deap, indpb)["best"]
+        choice = _selected[key]
+
+    if choice != "default":
+        backend = backends.get(choice)
+        if backend is not None and backend.available():
+            return backend
+        if (name, choice) not in _warned:
+            _warned.add((name, choice))
+            reason = "needs " + backend.requires if backend is not None else "does not apply"
+            print(f"--evaluator {choice} {reason} for {name} genes; using {DEFAULTS[name]}")
+
+    return backends[DEFAULTS[name]]
+
+# ===================== CALIBRATION =====================
+def cache_path():
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "point-scattering", "evaluators.json")
+
+def machine_key():
+    """Timings only carry over to the same machine and NumPy"""
+    return f"{platform.node()} {platform.machine()} {os.cpu_count()} cpu numpy {np.__version__}"
+
+def _read_cache(path):
+    try:
+        with open(path) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}           # Missing or unreadable: calibrate again
+
+def _write_cache(path, cache):
+    """Atomic replace, so concurrent runs never read half a file"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w") as tmp_file:
+        json.dump(cache, tmp_file, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+class _Genome(list):
+    """A bare list individual with the fitness slot evaluate_population fills"""
+    def __init__(self, points):
+        super().__init__(points)
+        self.fitness = SimpleNamespace(values=())
+
+def _workload(n, pop_size, sample_points, indpb, rng):
+    """
+    A population and its children: each gene of a child is redrawn with
+    probability indpb, roughly what crossover plus mutation change
+    """
+    parents = sample_points(rng, pop_size * n).reshape(pop_size, n, 2)
+    children = parents.copy()
+    redraw = rng.random_sample((pop_size, n)) < indpb
+    children[redraw] = sample_points(rng, int(redraw.sum()))
+    return parents, children
+
+def _time(backend, name, parents, children, repeat, deap):
+    """
+    Best seconds to evaluate the children: as DEAP individuals (after their
+    parents, so the incremental caches are warm) or as one array
+    """
+    polar = name != "cartesian"
+    best = math.inf
+    for _ in range(repeat):
+        if deap:
+            population = [_Genome(map(tuple, ind)) for ind in parents.tolist()]
+            utility.evaluate_population(population, backend.batch, polar, backend.incremental)
+            for ind, child in zip(population, children.tolist()):
+                ind[:] = map(tuple, child)          # Keeps the parent's nn_cache
+            start = time.perf_counter()
+            utility.evaluate_population(population, backend.batch, polar, backend.incremental)
+        else:
+            start = time.perf_counter()
+            backend.batch(children)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def calibrate(name, n, pop_size, sample_points, deap=True, indpb=0.2, repeat=3, seed=0):
+    """
+    Times every available back-end on one generation's evaluations, as
+    DEAP individuals (deap=True) or as one array for the array engines.
+    Returns {"best": name, "seconds": {back-end: seconds}}. Back-ends far
+    slower than the best on a small probe keep the probe's estimate
+    instead of being timed in full
+    """
+    rng = np.random.RandomState(seed)
+    parents, children = _workload(n, pop_size, sample_points, indpb, rng)
+    probe = min(8, pop_size)
+
+    seconds = {}
+    for backend in BACKENDS[name].values():
+        if not backend.available() or (backend.incremental and not deap):
+            continue
+
+        backend.batch(children[:2])     # Warm up: imports, JIT compilation
+        if seconds and not backend.incremental:
+            estimate = _time(backend, name, parents[:probe], children[:probe], 1, deap) * pop_size / probe
+            if estimate > 4 * min(seconds.values()):
+                seconds[backend.name] = estimate
+                continue
+
+        seconds[backend.name] = _time(backend, name, parents, children, repeat, deap)
+
+    return {"best": min(seconds, key=seconds.get), "seconds": seconds}
+
+def calibrated(name, n, pop_size, sample_points, deap=True, indpb=0.2, force=False):
+    """calibrate(), read from the on-disk cache when this machine has run it"""
+    path = cache_path()
+    key = f"{name} n={n} pop={pop_size} indpb={indpb} {'deap' if deap else 'array'}"
+
+    cache = _read_cache(path)
+    result = cache.get(machine_key(), {}).get(key)
+    if result is not None and not force and result["best"] in BACKENDS[name]:
+        return result
+
+    result = calibrate(name, n, pop_size, sample_points, deap, indpb)
+    cache = _read_cache(path)           # Another process may have added entries
+    cache.setdefault(machine_key(), {})[key] = result
+    try:
+        _write_cache(path, cache)
+    except OSError:
+        pass                # Read-only home: calibrate again next time
+    return result
+
+def main():
+    from implementations import boundary, cartesian, polar
+
+    samplers = {
+        "cartesian": cartesian.sample_cartesian_points,
+        "polar": polar.sample_polar_points,
+        "boundary": boundary.sample_boundary_points,
+    }
+
+    parser = argparse.ArgumentParser(description='Calibrate the fitness back-ends for --evaluator auto')
+    parser.add_argument('--rep', choices=list(BACKENDS), required=True, help='Representation')
+    parser.add_argument('--n', type=int, default=5, help='Number of points (default: 5)')
+    parser.add_argument('--pop', type=int, default=utility.Config().pop_size,
+                        help=f'Population size (default: {utility.Config().pop_size})')
+    parser.add_argument('--engine', choices=['deap', 'array'], default='deap',
+                        help='Engine to calibrate for; only deap can use incremental (default: deap)')
+    parser.add_argument('--force', action='store_true', help='Re-run even if cached')
+    args = parser.parse_args()
+
+    result = calibrated(args.rep, args.n, args.pop, samplers[args.rep],
+                        deap=args.engine == "deap", force=args.force)
+    for backend, seconds in sorted(result["seconds"].items(), key=lambda kv: kv[1]):
+        print(f"    {backend:12s} {seconds * 1e3:9.3f} ms")
+    print(f"auto -> {result['best']}  ({cache_path()})")
+
+if __name__ == "__main__":
+    main()
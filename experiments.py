@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+This is the experiment summary shared by the Point-Scattering Problem
+implementations: every representation's run_experiment hands its runs
+(in seed order) to summarize_experiment, which gathers the statistics,
+draws the plots and saves the --profile and stopping summaries.
+"""
+# Local Imports
+import background
+import plotting
+import profiling
+import trajectory
+import utility
+
+def summarize_experiment(args, name, label, runs, n_runs, polar=False):
+    """
+    Statistics, plots and summaries of an experiment's runs (run results in
+    seed order): what each representation's run_experiment returns.
+    name, label: the representation's file prefix and title
+    polar: genes are (r, theta), converted to X,Y for the final plot
+    """
+    # Per-generation and final statistics, updated as each run finishes
+    best_by_gen_stats = utility.RunningStats()
+    avg_by_gen_stats = utility.RunningStats()
+    best_overall_stats = utility.RunningStats()
+    cache_stats = None
+    evaluations = 0
+    profiles = []       # Per-run phase times (--profile)
+    stops = []          # Per-run generations used and stop reason
+
+    # Runs that stopped early are forward-filled to the full curve length
+    generations = utility.Config().generations
+    curve_length = generations + 1
+
+    # Tracking global best results
+    best_run_curve = None
+    best_ind = None
+    best_ind_fitness = -float("inf")
+
+    for cur_run in runs:
+        # Extract the data from current run
+        best_curve = utility.forward_fill(cur_run["best_by_gen"], curve_length)
+        best_by_gen_stats.add(best_curve)
+        avg_by_gen_stats.add(utility.forward_fill(cur_run["avg_by_gen"], curve_length))
+        best_overall_stats.add(cur_run["best_overall_fitness"])
+        cache_stats = utility.sum_cache_stats([cache_stats, cur_run["cache_stats"]])
+        evaluations += cur_run["evaluations"]
+        profiles.append(cur_run["profile"])
+        stops.append({key: cur_run[key] for key in ("generations", "stop_reason", "time_to_target")})
+
+        # Track the best fitness individual as encountered
+        if cur_run["best_overall_fitness"] > best_ind_fitness:
+            # Best found is current run
+            best_run_curve = best_curve
+            best_ind = cur_run["best_individual"]
+            best_ind_fitness = cur_run["best_overall_fitness"]
+
+    gen_mean, gen_CI_low, gen_CI_high = best_by_gen_stats.mean_ci95()
+    avg_mean, avg_CI_low, avg_CI_high = avg_by_gen_stats.mean_ci95()
+    mean_f, std_f, CI = best_overall_stats.summary()
+
+    # Phase breakdown of every run (--profile)
+    profile = profiling.summarize(profiles)
+    if profile is not None:
+        profiling.save(profile, trajectory.log_path(name, args.n, generations, "profile.json"))
+
+    # Generations used and time-to-target (--stall-window, --target, --time-budget)
+    stopping = utility.summarize_stopping(stops) if utility.StopRules.from_args(args).active() else None
+
+    # Plot best results
+    title = f"{label} Representation (n={args.n})"
+    filename = f"{name}_n{args.n}_best_run.png"
+    background.call(args, utility.plot_fitness_log, list(enumerate(best_run_curve)), title, filename,
+                    plotting.plot_options(args))
+
+    # Plot final point locations (Polar -> Cart)
+    if polar:
+        best_ind = utility.polar_to_cart(best_ind)
+    background.call(args, utility.plot_point_distribution, best_ind, title=f"Final Population (n={args.n})",
+        filename=f"{name}_n{args.n}_best_final.png",
+        options=plotting.plot_options(args))
+
+    return {
+        "n_runs": n_runs,
+        "best_overall": best_ind_fitness,
+        "evaluations": evaluations,
+        "cache_stats": cache_stats,
+        "profile": profile,
+        "stopping": stopping,
+        "final_stats": {
+            "mean": mean_f, 
+            "std":std_f, 
+            "CI95": CI
+        },
+        "gen_stats": {
+            "mean": gen_mean,
+            "CI95": (gen_CI_low, gen_CI_high)
+        },
+        "avg_gen_stats": {
+            "mean": avg_mean,
+            "CI95": (avg_CI_low, avg_CI_high)
+        }
+    }
@@ -8,9 +8,13 @@ import random
 import numpy as np
 from typing import Any, Dict, List
 from deap import base, creator, tools
-from dataclasses import asdict
 
 # Local Imports
+import array_engine
+import evaluators
+import experiments
+import profiling
+import trajectory
 import utility
 
 # Create n points within circle
@@ -56,8 +60,27 @@ def mutate_cartesian_ind(ind, indpb=0.2):
     # Return the newly mutated individuals as a tuple
     return (ind,)
 
+# Array engine: draw many points at once
+def sample_cartesian_points(rng, size):
+    """
+    Draws size (X,Y) points uniformly inside the unit circle, shape (size, 2).
+    Samples the disk directly (r = sqrt(u) keeps the area density uniform),
+    so unlike init_cartesian_ind no draws are rejected
+    """
+    r = np.sqrt(rng.uniform(0, 1, size))
+    theta = rng.uniform(0, 2*np.pi, size)
+    return np.column_stack((r * np.cos(theta), r * np.sin(theta)))
+
+ARRAY_REPRESENTATION = array_engine.Representation(
+    name="cartesian", label="Cartesian",
+    sample_points=sample_cartesian_points)
+
 # Cartesian Implementation
 def run_single(args):
+    # Array-backed population instead of DEAP individuals
+    if getattr(args, "engine", "deap") in ("array", "lockstep"):
+        return array_engine.run_single_array(args, ARRAY_REPRESENTATION)
+
     # Use Standard Config from Utitilty
     cfg = utility.Config()
 
@@ -66,11 +89,10 @@ def run_single(args):
     np.random.seed(args.seed)
 
     # DEAP creator setup
-    if not hasattr(creator, "FitnessMax"):
-        creator.create("FitnessMax", base.Fitness, weights=(1.0,))
+    utility.setup_creator()
 
-    if not hasattr(creator, "Individual"):
-        creator.create("Individual", list, fitness=creator.FitnessMax)
+    # Fitness back-end (--evaluator)
+    backend = evaluators.select(args, "cartesian", sample_cartesian_points)
 
     # Setup toolbox
     toolbox = base.Toolbox()
@@ -78,17 +100,23 @@ def run_single(args):
                      lambda: init_cartesian_ind(args.n))                            # links and creates individuals using custom function
     toolbox.register("population", tools.initRepeat, list, toolbox.individual)
     toolbox.register("evaluate", utility.calcMinEuclideanDistance)
+    toolbox.register("evaluate_batch", backend.batch)                               # Whole-population evaluator (--evaluator)
     toolbox.register("mate", tools.cxUniform, indpb=0.5)                            # Uniform crossover
     toolbox.register("mutate", mutate_cartesian_ind, indpb=args.indpb)
-    toolbox.register("select", tools.selTournament, tournsize=cfg.tournsize)
+    toolbox.register("select", utility.sel_tournament, tournsize=cfg.tournsize)    # On the fitness array
+
+    # Per-phase timing (--profile) and stopping rules (--stall-window, --target, --time-budget)
+    prof = profiling.start(args)
+    stop = utility.EarlyStop(utility.StopRules.from_args(args))
 
     # Create initial popultation
     population = toolbox.population(n=cfg.pop_size)
 
+    # Optional memo of already-seen genomes (--fitness-cache)
+    fit_cache = utility.make_fitness_cache(args, polar=False)
+
     # Evaluate initial population
-    fitnesses = map(toolbox.evaluate, population)
-    for ind, fit in zip(population, fitnesses):
-        ind.fitness.values = fit
+    evaluations = utility.evaluate_population(population, toolbox.evaluate_batch, incremental=backend.incremental, cache=fit_cache)
 
     # Track Performance of Generations
     log = []
@@ -96,32 +124,33 @@ def run_single(args):
     best_by_gen: List[float] = []
     avg_by_gen: List[float] = []
 
-    def record(gen_idx: int) -> None:
+    def record(fitness, best: int) -> None:
         """ Records the best and avg pop fitness for this gen"""
-        fits = [ind.fitness.values[0] for ind in population]
-        best = max(fits)
-        avg = float(np.mean(fits))
-
         # Append best and average of each gen to the list
-        best_by_gen.append(best)
-        avg_by_gen.append(avg)
+        best_by_gen.append(float(fitness[best]))
+        avg_by_gen.append(float(np.mean(fitness)))
 
-    record(0)
+    # Fitness of the population as one array: selection, best and average
+    # all read it instead of going through the individuals again
+    fitness = utility.fitness_array(population)
+    best = int(np.argmax(fitness))
+    record(fitness, best)
+    stop.update(0, best_by_gen[-1], evaluations)
 
-    # Open log file
-    log_filename = f"logs/cartesian_n{args.n}_gen{cfg.generations}.txt"
+    # Open generation log (text, or binary store with --log-format binary)
+    with trajectory.open_generation_log(args, "cartesian", "Cartesian", cfg) as log_gen:
+        prof.lap("init")
 
-    with open(log_filename, 'w') as log_file:
-        log_file.write(f"Cartesian Representation Log\n")
-        log_file.write(f"n={args.n}, generations={cfg.generations}, population={cfg.pop_size}\n")
-        log_file.write(f"crossover_prob={cfg.cxpb}, mutation_prob={cfg.mutpb}, indpb={args.indpb}, seed={args.seed}\n")
-        log_file.write("=" * 80 + "\n\n")
-        
-        # Evolution loop
+        # Evolution loop, until a stopping rule fires
         for gen in range(cfg.generations):
+            if stop.reason is not None:
+                break
+
             # Select offspring
-            offspring = toolbox.select(population, len(population))
+            offspring = toolbox.select(population, fitness, len(population))
+            prof.lap("select")
             offspring = list(map(toolbox.clone, offspring))
+            prof.lap("clone")
             
             # Apply crossover
             for i in range(0, len(offspring), 2):
@@ -133,103 +162,65 @@ def run_single(args):
                         toolbox.mate(child1, child2)
                         del child1.fitness.values
                         del child2.fitness.values
-            
+            prof.lap("crossover")
+
             # Apply mutation
             for mutant in offspring:
                 if random.random() < cfg.mutpb:
                     toolbox.mutate(mutant)
                     del mutant.fitness.values
-            
+            prof.lap("mutation")
+
             # Evaluate individuals with invalid fitness
             invalid_ind = []
             for ind in offspring:
                 if not ind.fitness.valid:   # Check Fitness
                     invalid_ind.append(ind)
 
-            fitnesses = map(toolbox.evaluate, invalid_ind)
-            for ind, fit in zip(invalid_ind, fitnesses):
-                ind.fitness.values = fit
+            evaluations += utility.evaluate_population(invalid_ind, toolbox.evaluate_batch, incremental=backend.incremental, cache=fit_cache)
+            prof.lap("evaluate")
             
             # Replace population
             for i in range(len(population)):
                 population[i] = offspring[i]
             
             # Get best individual of this generation
-            best_ind = tools.selBest(population, 1)[0]
+            fitness = utility.fitness_array(population)
+            best = int(np.argmax(fitness))
+            best_ind = population[best]
             best_fitness = best_ind.fitness.values[0]
             
             # Record performance
             log.append((gen, best_fitness))
-            record(gen)
-            
+            record(fitness, best)
+            stop.update(gen + 1, best_fitness, evaluations)
+            prof.lap("best")
+
             # Log this generation
-            utility.log_generation(log_file, gen, best_ind)
+            log_gen(gen, best_ind)
+            prof.lap("log")
     
     # Final best solution found in this run
-    best_individual = tools.selBest(population, 1)[0]
+    best_individual = population[best]
     best_fitness = best_individual.fitness.values[0]
 
     # return info for stat
-    return {
-        "best_by_gen": best_by_gen,
-        "avg_by_gen": avg_by_gen,
-        "best_individual": best_individual,
-        "best_overall_fitness": best_fitness,
-        "config": asdict(cfg)       # Current GA settings
-    }
+    return utility.run_result(best_by_gen, avg_by_gen, best_individual, best_fitness, evaluations, fit_cache,
+                              stop, prof.result(stop.generations, evaluations), cfg)
 
 # Multiple runs of the GA
 def run_experiment(args, n_runs: int = 25, seed_base: int = 12345) -> Dict[str, Any]:
-    best_by_gen_all = []
-    avg_by_gen_all = []
-    best_overall_all = []
-
-    # Tracking global best results
-    best_run_curve = None
-    best_ind = None
-    best_ind_fitness = -float("inf")
-
-    for i in range(n_runs):
-        # print(f"Run {i}")
-        args.seed = seed_base + i   # Creates a unique cfg for each run
-        cur_run = run_single(args)
-
-        # Extract the data from current run
-        best_by_gen_all.append(cur_run["best_by_gen"])
-        avg_by_gen_all.append(cur_run["avg_by_gen"])
-        best_overall_all.append(cur_run["best_overall_fitness"])
-
-        # Track the best fitness individual as encountered
-        if cur_run["best_overall_fitness"] > best_ind_fitness:
-            # Best found is current run
-            best_run_curve = cur_run["best_by_gen"]
-            best_ind = cur_run["best_individual"]
-            best_ind_fitness = cur_run["best_overall_fitness"]
- 
-    gen_mean, gen_CI_low, gen_CI_high = utility.per_gen_mean_ci(best_by_gen_all)
-    mean_f, std_f, CI = utility.mean_std_ci95(best_overall_all)
-
-    # Plot best results
-    title = f"Cartesian Representation (n={args.n})"
-    filename = f"cartesian_n{args.n}_best_run.png"
-    utility.plot_fitness_log(list(enumerate(best_run_curve)), title, filename)
-
-    # Plot final point locations
-    utility.plot_point_distribution(best_ind, title=f"Final Population (n={args.n})",
-        filename=f"cartesian_n{args.n}_best_final.png")
-
-    return {
-        "n_runs": n_runs,
-        "best_by_gen_all": best_by_gen_all,
-        "avg_by_gen_all": avg_by_gen_all,
-        "best_overall_all": best_overall_all,
-        "final_stats": {
-            "mean": mean_f, 
-            "std":std_f, 
-            "CI95": CI
-        },
-        "gen_stats": {
-            "mean": gen_mean,
-            "CI95": (gen_CI_low, gen_CI_high)
-        }
-    }
\ No newline at end of file
+    # --evaluator auto calibrates here, once, instead of in every worker
+    evaluators.select(args, "cartesian", sample_cartesian_points, deap=getattr(args, "engine", "deap") == "deap")
+
+    # Runs serially, or across args.workers processes, in seed order
+    # (--engine lockstep evolves them all together in one array)
+    seeds = [seed_base + i for i in range(n_runs)]
+    trajectory.prepare_store(args, "cartesian", "Cartesian", seeds)
+    if getattr(args, "engine", "deap") == "lockstep":
+        runs = array_engine.run_lockstep(args, ARRAY_REPRESENTATION, seeds)
+    else:
+        runs = utility.run_seeds(run_single, args, seeds)
+
+    # Statistics, plots, profile and stopping summaries over the runs
+    return experiments.summarize_experiment(args, "cartesian", "Cartesian", runs, n_runs)
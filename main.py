@@ -16,12 +16,16 @@ DEAP Functions - https://deap.readthedocs.io/en/master/api/tools.html
 
 # Standard libraries or third-party packages
 import argparse
+import copy
 import os
 import random
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 
 # Local Imports
 from implementations import cartesian, polar, boundary
+import background
+import evaluators
 import utility
 
 def setup_directories():
@@ -29,6 +33,30 @@ def setup_directories():
     os.makedirs('graphs', exist_ok=True)
     os.makedirs('logs', exist_ok=True)
 
+# Representation name -> (label, console header, implementation module)
+REPRESENTATIONS = {
+    "cartesian": ("Cartesian", "===== Cartesian Implementation (x, y) =====", cartesian),
+    "polar": ("Polar", "===== Polar Implementation (r, θ) =====", polar),
+    "boundary": ("Boundary", "===== Boundary Implementation (θ) =====", boundary),
+}
+
+def run_representation(name, args):
+    """
+    Runs one representation's experiment from a freshly seeded RNG state.
+    Module-level so it can also run inside a worker process
+    """
+    # Set seed
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+
+    return REPRESENTATIONS[name][2].run_experiment(args)
+
+def run_representation_worker(name, args):
+    """run_representation inside a --concurrent worker, which must finish its files first"""
+    results = run_representation(name, args)
+    background.flush()
+    return results
+
 def main():
     """Main function of the script."""
     parser = argparse.ArgumentParser(
@@ -41,40 +69,86 @@ def main():
                         help='Independent probability for mutating each gene (default: 0.2)')
     parser.add_argument('--seed', type=int, default=42,                 # Set seed value (shouldn't change)
                         help='Random seed for reproducibility (default: 42)')
-    
+    parser.add_argument('--workers', type=int, default=1,               # Spread the 25 runs over processes
+                        help='Worker processes for the independent runs (default: 1, serial)')
+    parser.add_argument('--engine', choices=['deap', 'array', 'lockstep'], default='deap',
+                        help='Population store: DEAP individuals, one NumPy array per run, '
+                             'or one array evolving all runs together (default: deap)')
+    parser.add_argument('--dtype', choices=['float64', 'float32'], default='float64',
+                        help='Gene precision for --engine array/lockstep (default: float64)')
+    parser.add_argument('--evaluator', choices=['default', 'auto'] + evaluators.NAMES, default='default',
+                        help='Fitness back-end; auto picks the fastest on this machine, '
+                             'calibrated once and cached (default: default, per representation)')
+    parser.add_argument('--fitness-cache', type=int, default=0,
+                        help='Remember the fitness of up to this many genomes, LRU (default: 0, off)')
+    parser.add_argument('--cache-rotation', action='store_true',
+                        help='Let --fitness-cache also match rotated copies of a genome')
+    parser.add_argument('--log-format', choices=['text', 'binary'], default='text',
+                        help='Generation logs: text (last run only) or one binary store of all runs (default: text)')
+    parser.add_argument('--log-mode', choices=['full', 'compact'], default='full',
+                        help='Text logs: every generation, or only when the best individual changes (default: full)')
+    parser.add_argument('--log-every', type=int, default=0,
+                        help='With --log-mode compact, also write every this many generations (default: 0, never)')
+    parser.add_argument('--background-io', action='store_true',
+                        help='Write logs and render plots on a background thread, overlapping the next run')
+    parser.add_argument('--plot-dpi', type=int, default=None,
+                        help='Resolution of the PNG plots (default: 300, or 72 with --plot-draft)')
+    parser.add_argument('--plot-format', choices=['png', 'svg'], default='png',
+                        help='Plot file format (default: png)')
+    parser.add_argument('--plot-draft', action='store_true',
+                        help='Fast preview plots: low DPI and no tight-layout passes')
+    parser.add_argument('--stall-window', type=int, default=0,
+                        help='Stop a run after this many generations without improvement (default: 0, never)')
+    parser.add_argument('--stall-tol', type=float, default=0.0,
+                        help='With --stall-window, gains up to this do not count as improvement (default: 0)')
+    parser.add_argument('--target', type=float, default=None,
+                        help='Stop a run once its best minimum distance reaches this; reports time-to-target')
+    parser.add_argument('--time-budget', type=float, default=None,
+                        help='Stop a run after this many seconds of wall-clock time')
+    parser.add_argument('--profile', action='store_true',
+                        help='Time each phase of the evolution loop; prints a breakdown and writes '
+                             'logs/<rep>_n<n>_gen200.profile.json')
+    parser.add_argument('--concurrent', action='store_true',            # One process per representation
+                        help='Run the three representations concurrently in separate processes')
+
     args = parser.parse_args()
+    if args.time_budget is not None and args.engine == 'lockstep':
+        parser.error("--time-budget is per run; --engine lockstep runs share one clock (use --engine array)")
     
     # Create output directories
     setup_directories()
     
-    # Set seed
-    random.seed(args.seed)
-    np.random.seed(args.seed)
-    
     print("!!!! Running Experiment with 25 trials !!!!\n")
 
-    # Run Cartesian Implementation
-    print("===== Cartesian Implementation (x, y) =====")
-    cart_results = cartesian.run_experiment(args)
-    utility.print_results("Cartesian", cart_results)
-    
-    # Set seed
-    random.seed(args.seed)
-    np.random.seed(args.seed)
-    
-    # Run Polar Implementation
-    print("===== Polar Implementation (r, θ) =====")
-    polar_results = polar.run_experiment(args)
-    utility.print_results("Polar", polar_results)
+    try:
+        if args.concurrent:
+            run_concurrent(args)
+            return
 
-    # Set seed
-    random.seed(args.seed)
-    np.random.seed(args.seed)
-    
-    # Run Custom Boundary Implementation
-    print("===== Boundary Implementation (θ) =====")
-    bound_results = boundary.run_experiment(args)
-    utility.print_results("Boundary", bound_results)
+        for name in REPRESENTATIONS:
+            label, header, _ = REPRESENTATIONS[name]
+            print(header)
+            results = run_representation(name, args)
+            utility.print_results(label, results)
+    finally:
+        # Wait for queued logs/plots and report any error they hit
+        background.shutdown()
+
+def run_concurrent(args):
+    """
+    Runs every representation in its own process. Results are printed in
+    the usual order, each as soon as it (and the ones before it) finish
+    """
+    background.flush()      # No forking while the writer thread is mid-job
+    with ProcessPoolExecutor(max_workers=len(REPRESENTATIONS)) as executor:
+        futures = {name: executor.submit(run_representation_worker, name, copy.copy(args))
+                   for name in REPRESENTATIONS}
+
+        for name, future in futures.items():
+            label, header, _ = REPRESENTATIONS[name]
+            results = future.result()
+            print(header)
+            utility.print_results(label, results)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+This is the plot rendering for the Point-Scattering Problem implementations.
+
+Plots are drawn on matplotlib's non-interactive Agg canvas (no pyplot, so
+rendering is safe on the --background-io thread) using figure templates:
+each process builds the fitness-curve and point-distribution figures once,
+and every plot after that only swaps in its data and title.
+
+Options (main.py flags):
+    --plot-dpi DPI          resolution of PNG output (default: 300)
+    --plot-format svg       vector output instead of PNG
+    --plot-draft            fast preview: 72 dpi and no tight-layout passes
+
+The graphs/ plots can be regenerated from binary trajectory stores
+(--log-format binary), rendering in parallel worker processes:
+    python plotting.py logs/*.npy --workers 4
+    python plotting.py --draft          # Every experiment store in logs/, draft quality
+"""
+# Standard libraries or third-party packages
+import argparse
+import functools
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, List
+import numpy as np
+
+DEFAULT_DPI = 300
+DRAFT_DPI = 72
+
+# ===================== OPTIONS =====================
+@dataclass
+class PlotOptions:
+    dpi: int = DEFAULT_DPI
+    fmt: str = "png"            # "png" or "svg"
+    draft: bool = False         # Skip tight_layout and the tight bounding box
+
+def plot_options(args):
+    """PlotOptions from the --plot-* flags (defaults when they are missing)"""
+    draft = getattr(args, "plot_draft", False)
+    dpi = getattr(args, "plot_dpi", None) or (DRAFT_DPI if draft else DEFAULT_DPI)
+    return PlotOptions(dpi=dpi, fmt=getattr(args, "plot_format", "png"), draft=draft)
+
+def output_path(filename, options, directory="graphs"):
+    """graphs/<filename> with the extension of the chosen format"""
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(directory, f"{stem}.{options.fmt}")
+
+# ===================== FIGURE TEMPLATES =====================
+class FigureTemplate:
+    """An Agg figure with one axes, built once and refilled for every plot"""
+    def __init__(self, figsize):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.fig = Figure(figsize=figsize)
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+
+        # tight_layout moves the axes; every plot starts from the fresh layout
+        params = self.fig.subplotpars
+        self.layout = dict(left=params.left, bottom=params.bottom, right=params.right,
+                           top=params.top, wspace=params.wspace, hspace=params.hspace)
+
+    def update(self, data, title):
+        raise NotImplementedError
+
+    def save(self, path, options):
+        if options.draft:
+            # PNG compression dominates the save time; trade file size for speed
+            self.fig.savefig(path, dpi=options.dpi, format=options.fmt,
+                             **({"pil_kwargs": {"compress_level": 1}} if options.fmt == "png" else {}))
+            return
+
+        self.fig.subplots_adjust(**self.layout)
+        self.fig.tight_layout()
+        self.fig.savefig(path, dpi=options.dpi, format=options.fmt, bbox_inches='tight')
+
+class FitnessFigure(FigureTemplate):
+    """Fitness (minimum distance) over generations, with the last point labelled"""
+    def __init__(self):
+        super().__init__(figsize=(10, 6))
+        ax = self.ax
+
+        self.line, = ax.plot([], [], linewidth=2, color='blue')
+        self.marker, = ax.plot([], [], 'ro', markersize=8)
+        ax.set_xlabel('Generation', fontsize=12)
+        ax.set_ylabel('Minimum Pairwise Distance', fontsize=12)
+        self.title = ax.set_title('', fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+
+        self.label = ax.annotate('', xy=(0, 0),
+                                 xytext=(-80, 10),
+                                 textcoords='offset points',
+                                 fontsize=10,
+                                 bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=1),
+                                 arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
+
+    def update(self, log, title):
+        generations = [entry[0] for entry in log]       # First element is generation number
+        fitness_values = [entry[1] for entry in log]    # Second element is fitness value
+        best_gen, best_fitness = generations[-1], fitness_values[-1]
+
+        self.line.set_data(generations, fitness_values)
+        self.marker.set_data([best_gen], [best_fitness])
+        self.label.xy = (best_gen, best_fitness)
+        self.label.set_text(f'Gen {best_gen}: {best_fitness:.4f}')
+        self.title.set_text(title)
+
+        # Limits follow the new data, as a fresh figure's would
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+class DistributionFigure(FigureTemplate):
+    """Points inside the unit circle, with the origin marked"""
+    def __init__(self):
+        from matplotlib.patches import Circle
+
+        super().__init__(figsize=(6, 6))
+        ax = self.ax
+
+        self.points = ax.scatter([], [])
+        ax.add_artist(Circle((0, 0), 1.0, fill=False, linewidth=2))
+        ax.plot(0, 0, 'ro', markersize=5)
+
+        ax.set_xlabel('X', fontsize=12)
+        ax.set_ylabel('Y', fontsize=12)
+        self.title = ax.set_title('', fontsize=14, fontweight='bold')
+        ax.axis('equal')
+        ax.set_xlim(-1.1, 1.1)
+        ax.set_ylim(-1.1, 1.1)
+        ax.set_aspect('equal', adjustable='box')
+        ax.grid(True, alpha=0.3)
+
+    def update(self, points, title):
+        self.points.set_offsets(np.asarray(points, dtype=float).reshape(-1, 2))
+        self.title.set_text(title)
+
+TEMPLATES = {
+    "fitness": FitnessFigure,
+    "distribution": DistributionFigure,
+}
+
+_figures = {}       # Templates built in this process, by kind
+
+def _figure(kind):
+    if kind not in _figures:
+        _figures[kind] = TEMPLATES[kind]()
+    return _figures[kind]
+
+# ===================== RENDERING =====================
+@dataclass
+class PlotJob:
+    kind: str           # Key of TEMPLATES
+    data: Any           # Fitness log [(gen, fitness), ...] or X,Y points
+    title: str
+    filename: str       # Name inside graphs/; the extension follows the format
+
+def render(job, options=None, directory="graphs"):
+    """Draws one plot on this process's template and saves it. Returns the path"""
+    options = options or PlotOptions()
+    figure = _figure(job.kind)
+    figure.update(job.data, job.title)
+
+    path = output_path(job.filename, options, directory)
+    figure.save(path, options)
+    return path
+
+def render_all(jobs: List[PlotJob], options=None, workers=1, directory="graphs"):
+    """
+    Renders every job, across `workers` processes when more than one.
+    Each worker reuses its templates for all of its jobs. Returns the paths
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return [render(job, options, directory) for job in jobs]
+
+    draw = functools.partial(render, options=options, directory=directory)
+    workers = min(workers, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(draw, jobs, chunksize=max(1, len(jobs) // (4 * workers))))
+
+# ===================== REGENERATING graphs/ =====================
+def jobs_from_store(store_path):
+    """
+    The two plots run_experiment draws, rebuilt from a binary trajectory
+    store: the fitness curve of the best run (from generation 1) and its
+    final points
+    """
+    import trajectory
+    import utility
+
+    header, store = trajectory.open_store(store_path)
+    name, n = header["representation"], header["n"]
+
+    # Only finished runs (a partial store has NaN rows at the end)
+    done = [run for run in range(store.shape[0]) if not np.isnan(store[run, -1]).any()]
+    if not done:
+        return []
+
+    best_run, best_curve = None, None
+    for run in done:
+        curve = utility.calcMinEuclideanDistanceBatch(store[run])
+        if best_curve is None or curve[-1] > best_curve[-1]:      # First best, as run_experiment
+            best_run, best_curve = run, curve
+
+    # best_by_gen[0] is the initial population, which the store does not
+    # hold: logged generation g is point g + 1 of run_experiment's curve
+    return [
+        PlotJob("fitness", list(enumerate(best_curve.tolist(), start=1)),
+                f"{header['label']} Representation (n={n})", f"{name}_n{n}_best_run.png"),
+        PlotJob("distribution", np.array(store[best_run, -1]),
+                f"Final Population (n={n})", f"{name}_n{n}_best_final.png"),
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description='Regenerate graphs/ from binary trajectory stores')
+    parser.add_argument('stores', nargs='*',
+                        help='.npy stores to plot (default: every experiment store in logs/)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Rendering processes (default: one per CPU)')
+    parser.add_argument('--dpi', type=int, default=None,
+                        help=f'PNG resolution (default: {DEFAULT_DPI}, or {DRAFT_DPI} with --draft)')
+    parser.add_argument('--format', choices=['png', 'svg'], default='png',
+                        help='Output format (default: png)')
+    parser.add_argument('--draft', action='store_true',
+                        help='Fast preview: low DPI and no tight-layout passes')
+    parser.add_argument('--out', default='graphs',
+                        help='Output directory (default: graphs)')
+    args = parser.parse_args()
+
+    options = plot_options(argparse.Namespace(plot_dpi=args.dpi, plot_format=args.format,
+                                              plot_draft=args.draft))
+    os.makedirs(args.out, exist_ok=True)
+
+    jobs = []
+    # Experiment stores only: single-run ..._seed<seed>.npy stores would redraw the same plots
+    stores = args.stores or sorted(path for path in glob.glob("logs/*.npy") if "_seed" not in path)
+    for store_path in stores:
+        jobs.extend(jobs_from_store(store_path))
+
+    for path in render_all(jobs, options, args.workers, args.out):
+        print(path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+This is the per-phase profiler of the evolution loop for the
+Point-Scattering Problem implementations (--profile).
+
+Each run times its loop lap by lap: one perf_counter() call at the end of
+every phase adds the time since the previous one to that phase, so the
+phases always sum to the run's loop time. Without --profile every lap goes
+to a do-nothing stand-in, which costs a method call per phase.
+
+Phases:
+    init        initial population, its evaluation, opening the log
+    select      tournament selection
+    clone       copying the selected individuals
+    crossover   uniform crossover
+    mutation    mutation
+    evaluate    finding and evaluating the changed individuals
+    best        replacing the population, fitness array, best and average
+    log         writing the generation log (only queuing it with --background-io)
+
+With --engine lockstep all runs share one loop, so each run is given an
+equal share of its block's phase times (its evaluation count is its own).
+"""
+# Standard libraries or third-party packages
+import json
+import time
+
+PHASES = ("init", "select", "clone", "crossover", "mutation", "evaluate", "best", "log")
+
+class PhaseProfile:
+    """Seconds spent in each phase, accumulated lap by lap"""
+    def __init__(self):
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Charges the time since the previous lap to phase"""
+        now = time.perf_counter()
+        self.seconds[phase] += now - self._last
+        self._last = now
+
+    def result(self, generations, evaluations):
+        return {"seconds": dict(self.seconds), "generations": generations, "evaluations": evaluations}
+
+class NullProfile:
+    """Stand-in used without --profile"""
+    def lap(self, phase):
+        pass
+
+    def result(self, generations, evaluations):
+        return None
+
+_NULL = NullProfile()
+
+def start(args):
+    """A running PhaseProfile with --profile, else the do-nothing stand-in"""
+    return PhaseProfile() if getattr(args, "profile", False) else _NULL
+
+# ===================== COMBINING RUNS =====================
+def share(profile, runs, generations, evaluations):
+    """One run's part of a lockstep block's profile (its own generations and evaluations)"""
+    if profile is None:
+        return None
+    return {"seconds": {phase: seconds / runs for phase, seconds in profile["seconds"].items()},
+            "generations": generations, "evaluations": evaluations}
+
+def total(profiles):
+    """Sum of run profiles"""
+    return {
+        "seconds": {phase: sum(p["seconds"][phase] for p in profiles) for phase in PHASES},
+        "generations": sum(p["generations"] for p in profiles),
+        "evaluations": sum(p["evaluations"] for p in profiles),
+    }
+
+def summarize(profiles):
+    """{"runs": [...], "total": {...}} of an experiment, or None without --profile"""
+    profiles = [p for p in profiles if p is not None]
+    if not profiles:
+        return None
+    return {"phases": list(PHASES), "runs": profiles, "total": total(profiles)}
+
+def save(summary, path):
+    with open(path, "w") as json_file:
+        json.dump(summary, json_file, indent=1)
+
+# ===================== REPORT =====================
+def format_table(summary):
+    """Per-run and total seconds per phase, then each phase's share"""
+    header = f"{'run':>6}" + "".join(f"{phase:>10}" for phase in PHASES) + f"{'total':>10}{'evals':>9}"
+    lines = ["Phase breakdown (seconds):", header]
+
+    def row(label, profile):
+        seconds = profile["seconds"]
+        return (f"{label:>6}" + "".join(f"{seconds[phase]:10.4f}" for phase in PHASES)
+                + f"{sum(seconds.values()):10.4f}{profile['evaluations']:9d}")
+
+    for run, profile in enumerate(summary["runs"], start=1):
+        lines.append(row(str(run), profile))
+
+    tot = summary["total"]
+    elapsed = sum(tot["seconds"].values()) or 1.0
+    lines.append(row("total", tot))
+    lines.append(f"{'%':>6}" + "".join(f"{100 * tot['seconds'][phase] / elapsed:9.1f}%" for phase in PHASES))
+
+    evals = tot["evaluations"]
+    per_eval = f", {1e6 * tot['seconds']['evaluate'] / evals:.2f} us per evaluation" if evals else ""
+    lines.append(f"{evals} evaluations over {tot['generations']} generations, "
+                 f"{1e3 * elapsed / max(tot['generations'], 1):.3f} ms per generation{per_eval}")
+    return "\n".join(lines)
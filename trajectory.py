@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+This file holds the generation logging for the Point-Scattering Problem
+implementations.
+
+Every generation's best individual (as X,Y points) goes to one of:
+    text   - logs/<rep>_n<n>_gen<G>.txt, one "Gen k: [...]" line per generation
+             (utility.log_generation), last run of an experiment only
+    binary - logs/<rep>_n<n>_gen<G>.npy, a (runs, generations, n, 2) float64
+             array holding every run, written in place through a memory map,
+             plus a small JSON header (.json beside it) with config and seeds;
+             a run outside an experiment gets its own ..._seed<seed>.npy
+
+With --log-mode compact the text log only gets a line when the best
+individual changes (or every --log-every generations), using:
+    Gen 5: [(x,y), ...]         full individual, as in the regular logs
+    Gen 6-19: [(x,y), ...]      the same individual for generations 6 to 19
+    Gen 20: {0:(x,y), 3:(x,y)}  the previous line with points 0 and 3 replaced
+    Gen 21-40: {}               the previous line, unchanged, for 21 to 40
+
+Text logs are read lazily through GenerationLog (memory-mapped, with an
+offset index cached as <log>.idx.npz for random access by generation).
+The binary store can be exported back to the text format, and compact
+logs expanded back to one line per generation:
+    python trajectory.py export logs/cartesian_n5_gen200.npy --run 24
+    python trajectory.py expand logs/cartesian_n5_gen200.txt --out full.txt
+"""
+# Standard libraries or third-party packages
+import argparse
+import json
+import os
+import re
+from contextlib import contextmanager
+from dataclasses import asdict
+import numpy as np
+
+# Local Imports
+import background
+import utility
+
+# ===================== HELPERS =====================
+def log_path(name, n, generations, ext):
+    return f"logs/{name}_n{n}_gen{generations}.{ext}"
+
+def log_filename_for(args, filename):
+    """The run's text log file, or os.devnull when another run owns the log"""
+    if getattr(args, "write_log", True):
+        return filename
+    return os.devnull
+
+def header_path(store_path):
+    return os.path.splitext(store_path)[0] + ".json"
+
+def write_text_header(log_file, label, n, cfg, indpb, seed):
+    """Header block at the top of every text log"""
+    log_file.write(f"{label} Representation Log\n")
+    log_file.write(f"n={n}, generations={cfg.generations}, population={cfg.pop_size}\n")
+    log_file.write(f"crossover_prob={cfg.cxpb}, mutation_prob={cfg.mutpb}, indpb={indpb}, seed={seed}\n")
+    log_file.write("=" * 80 + "\n\n")
+
+# ===================== BINARY STORE =====================
+def create_store(path, name, label, n, cfg, indpb, seeds):
+    """
+    Creates an empty store for len(seeds) runs. Rows not written yet hold
+    NaN, so a partial experiment is recognisable
+    """
+    header = {
+        "representation": name,
+        "label": label,
+        "n": n,
+        "indpb": indpb,
+        "seeds": list(seeds),
+        "config": asdict(cfg),
+        "shape": [len(seeds), cfg.generations, n, 2],
+        "dtype": "float64",
+    }
+    with open(header_path(path), 'w') as header_file:
+        json.dump(header, header_file, indent=2)
+
+    store = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64,
+                                      shape=tuple(header["shape"]))
+    store[...] = np.nan
+    store.flush()
+    del store
+
+def read_header(path):
+    with open(header_path(path)) as header_file:
+        return json.load(header_file)
+
+def open_store(path, mode='r'):
+    """(header, memory-mapped (runs, generations, n, 2) array)"""
+    return read_header(path), np.load(path, mmap_mode=mode)
+
+def prepare_store(args, name, label, seeds):
+    """
+    Called by run_experiment before its runs: with --log-format binary,
+    creates the store every run (in any process) then writes its row to
+    """
+    if getattr(args, "log_format", "text") != "binary":
+        return
+    cfg = utility.Config()
+    path = log_path(name, args.n, cfg.generations, "npy")
+    background.call(args, create_store, path, name, label, args.n, cfg, args.indpb, seeds)
+
+def single_run_path(store_path, seed):
+    """<rep>_n<n>_gen<G>_seed<seed>.npy, the store of a run outside an experiment"""
+    return f"{os.path.splitext(store_path)[0]}_seed{seed}.npy"
+
+def _store_row(args, name, label, cfg):
+    """
+    Opens the store for this run's row. A run outside run_experiment (or
+    with a seed the experiment's store does not know) gets a single-run
+    store of its own, so an existing experiment is never overwritten
+    """
+    path = log_path(name, args.n, cfg.generations, "npy")
+    try:
+        header = read_header(path)
+        if args.seed in header["seeds"] and header["shape"][1:] == [cfg.generations, args.n, 2]:
+            return np.load(path, mmap_mode='r+'), header["seeds"].index(args.seed)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    path = single_run_path(path, args.seed)
+    create_store(path, name, label, args.n, cfg, args.indpb, [args.seed])
+    return np.load(path, mmap_mode='r+'), 0
+
+# ===================== RUN LOGGING =====================
+def _open_sink(args, name, label, cfg):
+    """
+    Opens the run's log in the format chosen by --log-format/--log-mode.
+    Returns (log(gen, points), close())
+    """
+    if getattr(args, "log_format", "text") == "binary":
+        store, row = _store_row(args, name, label, cfg)
+        last = [-1]         # Last generation written
+
+        def log(gen, points):
+            store[row, gen] = np.asarray(points, dtype=np.float64)    # Converting first is ~4x faster for lists
+            last[0] = gen
+
+        def close():
+            # A run that stopped early keeps its last best individual for the
+            # remaining generations, like its forward-filled fitness curve
+            if 0 <= last[0] < store.shape[1] - 1:
+                store[row, last[0] + 1:] = store[row, last[0]]
+            store.flush()
+
+        return log, close
+
+    log_file = open(log_filename_for(args, log_path(name, args.n, cfg.generations, "txt")), 'w')
+    write_text_header(log_file, label, args.n, cfg, args.indpb, args.seed)
+
+    if getattr(args, "log_mode", "full") == "compact":
+        compact = CompactTextLog(log_file, getattr(args, "log_every", 0))
+
+        def close():
+            compact.flush()
+            log_file.close()
+
+        return compact.log, close
+
+    def log(gen, points):
+        utility.log_generation(log_file, gen, points)
+
+    return log, log_file.close
+
+@contextmanager
+def open_generation_log(args, name, label, cfg):
+    """
+    Context manager yielding log(gen, points), which records a generation's
+    best individual (as X,Y points). With --background-io, opening, writing
+    and closing all happen in order on the background writer thread
+    """
+    if not background.enabled(args):
+        log, close = _open_sink(args, name, label, cfg)
+        try:
+            yield log
+        finally:
+            close()
+        return
+
+    writer = background.get_writer()
+    sink = []
+    writer.submit(lambda: sink.extend(_open_sink(args, name, label, cfg)))
+
+    def log_async(gen, points):
+        # Copy now: the caller may reuse the array for the next generation
+        writer.submit(lambda points=np.array(points, dtype=np.float64): sink[0](gen, points))
+
+    try:
+        yield log_async
+    finally:
+        writer.submit(lambda: sink[1]())
+
+# ===================== COMPACT TEXT LOG =====================
+class CompactTextLog:
+    """
+    Writes generations in the compact text format: consecutive generations
+    with the same best individual share one range line, and a line only
+    lists the points that differ from the previous line when that is shorter.
+    every: also end the current range every this many generations (0 = never)
+    """
+    def __init__(self, log_file, every=0):
+        self.log_file = log_file
+        self.every = every
+        self.last_written = None    # Point strings of the previous line
+        self.pending = None         # Point strings waiting to be written
+        self.start = self.end = 0
+
+    def log(self, gen, points):
+        strs = utility.format_points(points)
+        if self.pending is not None and strs == self.pending:
+            self.end = gen
+        else:
+            self.flush()
+            self.pending = strs
+            self.start = self.end = gen
+
+        if self.every and (gen + 1) % self.every == 0:
+            self.flush()
+
+    def flush(self):
+        if self.pending is None:
+            return
+
+        gens = f"{self.start}" if self.start == self.end else f"{self.start}-{self.end}"
+        changed = None
+        if self.last_written is not None and len(self.last_written) == len(self.pending):
+            changed = [i for i, (old, new) in enumerate(zip(self.last_written, self.pending)) if old != new]
+
+        if changed is not None and len(changed) < len(self.pending) / 2:
+            delta = ', '.join(f"{i}:{self.pending[i]}" for i in changed)
+            self.log_file.write(f"Gen {gens}: {{{delta}}}\n")
+        else:
+            self.log_file.write(f"Gen {gens}: [{', '.join(self.pending)}]\n")
+
+        self.last_written = self.pending
+        self.pending = None
+
+# ===================== READING TEXT LOGS =====================
+_GEN_LINE = re.compile(r"^Gen (\d+)(?:-(\d+))?: (.*)$")
+_POINT = re.compile(r"\(([^,()]+),([^,()]+)\)")
+_DELTA_POINT = re.compile(r"(\d+):(\([^,()]+,[^,()]+\))")
+
+def iter_log_lines(lines):
+    """
+    Expands the "Gen ..." lines of a full or compact text log.
+    Yields (generation, list of '(x,y)' strings) for every generation
+    """
+    current = None
+    for line in lines:
+        match = _GEN_LINE.match(line.rstrip("\n"))
+        if match is None:
+            continue        # Header lines
+
+        first = int(match.group(1))
+        last = int(match.group(2) or first)
+        body = match.group(3)
+
+        if body.startswith("{"):
+            current = list(current)
+            for index, point in _DELTA_POINT.findall(body):
+                current[int(index)] = point
+        else:
+            current = [f"({x},{y})" for x, y in _POINT.findall(body)]
+
+        for gen in range(first, last + 1):
+            yield gen, current
+
+def read_log(path):
+    """Yields (generation, (n, 2) array of X,Y) from a full or compact text log"""
+    with GenerationLog(path) as log:
+        yield from log
+
+def expand_log(path, out_path):
+    """Rewrites a compact text log as the regular one-line-per-generation log"""
+    with open(path) as log_file, open(out_path, 'w') as out_file:
+        for line in log_file:
+            if line.startswith("Gen "):
+                break
+            out_file.write(line)        # Header block
+
+        log_file.seek(0)
+        for gen, strs in iter_log_lines(log_file):
+            out_file.write(f"Gen {gen}: [{', '.join(strs)}]\n")
+
+    return out_path
+
+# ===================== STREAMING READER =====================
+_GEN_LINE_BYTES = re.compile(rb"^Gen (\d+)(?:-(\d+))?: ([\[{])", re.MULTILINE)
+_DELTA_POINT_BYTES = re.compile(rb"(\d+):\(([^,()]+),([^,()]+)\)")
+
+def index_path(log_path):
+    return os.path.splitext(log_path)[0] + ".idx.npz"
+
+class GenerationLog:
+    """
+    Memory-mapped reader for full or compact text logs.
+    Iterating yields (generation, (n, 2) X,Y array) lazily, one line parsed
+    at a time. log[gen] reads any single generation through an offset index
+    of the "Gen" lines, built on first use and cached beside the log
+    (<log>.idx.npz, rebuilt when the log's size or mtime changes)
+    """
+    # Index columns: first and last generation of the line, byte offset of
+    # its points, and the row of the last full line (a delta line's base)
+    FIRST, LAST, OFFSET, BASE = range(4)
+
+    def __init__(self, path, cache_index=True):
+        import mmap
+
+        self.path = path
+        self.cache_index = cache_index
+        self._file = open(path, 'rb')
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b""         # An empty file cannot be mapped
+        self._index = None
+
+    def close(self):
+        if self._map:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ----- parsing -----
+    def _body(self, offset):
+        end = self._map.find(b"\n", offset)
+        return self._map[offset:end if end != -1 else len(self._map)]
+
+    @staticmethod
+    def _parse_full(body):
+        return np.array(body.translate(None, b"()[] \r").split(b","), dtype=np.float64).reshape(-1, 2)
+
+    @staticmethod
+    def _apply_delta(points, body):
+        points = points.copy()
+        for index, x, y in _DELTA_POINT_BYTES.findall(body):
+            points[int(index)] = (float(x), float(y))
+        return points
+
+    def __iter__(self):
+        points = None
+        for match in _GEN_LINE_BYTES.finditer(self._map):
+            first = int(match.group(1))
+            last = int(match.group(2) or first)
+            body = self._body(match.start(3))
+
+            if match.group(3) == b"{":
+                points = self._apply_delta(points, body)
+            else:
+                points = self._parse_full(body)
+
+            for gen in range(first, last + 1):
+                yield gen, points.copy()
+
+    # ----- random access -----
+    def _stamp(self):
+        stat = os.stat(self.path)
+        return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    def _build_index(self):
+        rows = []
+        base = -1
+        for match in _GEN_LINE_BYTES.finditer(self._map):
+            if match.group(3) == b"[":
+                base = len(rows)
+            first = int(match.group(1))
+            rows.append((first, int(match.group(2) or first), match.start(3), base))
+        return np.array(rows, dtype=np.int64).reshape(-1, 4)
+
+    @property
+    def index(self):
+        """(lines, 4) int64 array, see the column constants"""
+        if self._index is not None:
+            return self._index
+
+        stamp = self._stamp()
+        cache = index_path(self.path)
+        if self.cache_index:
+            try:
+                with np.load(cache) as cached:
+                    if np.array_equal(cached["stamp"], stamp):
+                        self._index = cached["index"]
+                        return self._index
+            except (OSError, KeyError, ValueError):
+                pass        # Missing, stale format or unreadable: rebuild
+
+        self._index = self._build_index()
+        if self.cache_index:
+            try:
+                tmp = cache + ".tmp.npz"
+                np.savez(tmp, index=self._index, stamp=stamp)
+                os.replace(tmp, cache)
+            except OSError:
+                pass        # Read-only directory: keep the index in memory only
+        return self._index
+
+    def __len__(self):
+        """Number of generations in the log"""
+        index = self.index
+        return int(index[-1, self.LAST]) + 1 if len(index) else 0
+
+    def __getitem__(self, gen):
+        index = self.index
+        if gen < 0:
+            gen += len(self)
+
+        row = int(np.searchsorted(index[:, self.FIRST], gen, side='right')) - 1
+        if row < 0 or gen > index[row, self.LAST]:
+            raise IndexError(f"generation {gen} is not in {self.path}")
+
+        # A delta line is its base full line plus every delta line after it
+        base = int(index[row, self.BASE])
+        points = self._parse_full(self._body(int(index[base, self.OFFSET])))
+        for line in range(base + 1, row + 1):
+            points = self._apply_delta(points, self._body(int(index[line, self.OFFSET])))
+        return points
+
+# ===================== EXPORT =====================
+def export_text(store_path, run=-1, out_path=None):
+    """
+    Writes one run of a binary store in the text log format.
+    Returns the path written (defaults to the store path with .txt)
+    """
+    header, store = open_store(store_path)
+    cfg = utility.Config(**header["config"])
+    seed = header["seeds"][run]
+
+    if out_path is None:
+        out_path = os.path.splitext(store_path)[0] + ".txt"
+
+    with open(out_path, 'w') as log_file:
+        write_text_header(log_file, header["label"], header["n"], cfg, header["indpb"], seed)
+        for gen, points in enumerate(store[run]):
+            if np.isnan(points).any():
+                break           # Run stopped (or was never written) here
+            utility.log_generation(log_file, gen, points)
+
+    return out_path
+
+def main():
+    parser = argparse.ArgumentParser(description='Binary trajectory store tools')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    export = sub.add_parser('export', help='Write one run of a .npy store as a text log')
+    export.add_argument('store', help='Path to the .npy store')
+    export.add_argument('--run', type=int, default=-1,
+                        help='Run index to export (default: -1, the last run like the text logs)')
+    export.add_argument('--out', default=None,
+                        help='Output path (default: the store path with .txt)')
+
+    expand = sub.add_parser('expand', help='Rewrite a compact text log with one line per generation')
+    expand.add_argument('log', help='Path to the compact .txt log')
+    expand.add_argument('--out', required=True, help='Output path')
+
+    args = parser.parse_args()
+    if args.command == 'export':
+        print(export_text(args.store, args.run, args.out))
+    elif args.command == 'expand':
+        print(expand_log(args.log, args.out))
+
+if __name__ == "__main__":
+    main()
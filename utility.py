@@ -5,16 +5,26 @@ functions are stored for our Point-Scattering
 Problem implementations.
 """
 # Standard libraries or third-party packages
+import copy
+import functools
 import math                                 # For calculations
+import random                               # Tournament draws
+import time                                 # Wall-clock budget of --time-budget
+from collections import Counter, OrderedDict    # Stop reasons, LRU fitness cache
+from concurrent.futures import ProcessPoolExecutor     # Parallel runs
 import numpy as np
-import matplotlib.pyplot as plt             # For plots
-from scipy import stats       
 from dataclasses import dataclass, asdict   # Used for the GA parameters
 from typing import List, Optional
-from deap import base, creator, tools       # DEAP and helpers
+from deap import base, creator              # DEAP and helpers
 
 # Local Imports
-from implementations import cartesian, polar, boundary
+import background
+import profiling
+
+# matplotlib (plots, see plotting.py), scipy.stats (confidence intervals)
+# and scipy.spatial (KD-tree for large n) take about a second to import
+# between them, so they are imported inside the functions that need them,
+# on first use.
 
 # ===================== MATHEMATICAL FORMULAS =====================
 # Insert commonly used functions here.
@@ -75,6 +85,185 @@ def calcMinEuclideanDistancePolar(points):
 
     return (min_dist,)
 
+# Upper bound on the number of pair distances held in memory at once
+# by the batched evaluators. Keeps large n from allocating gigabytes, and
+# big batches (--engine lockstep) working on cache-sized temporaries
+BATCH_PAIR_LIMIT = 2**16
+
+def _pair_chunks(n_individuals, n_pairs):
+    """
+    Splits a batch of individuals into slices whose pair arrays fit
+    within BATCH_PAIR_LIMIT
+    """
+    step = max(1, BATCH_PAIR_LIMIT // max(1, n_pairs))
+    for start in range(0, n_individuals, step):
+        yield start, min(start + step, n_individuals)
+
+# Calculates using a whole batch of Cartesian Points at once
+def calcMinEuclideanDistanceBatch(points_batch, spatial_index=True):
+    """
+    Vectorized calcMinEuclideanDistance for a whole population
+    points_batch: array of shape (individuals, n, 2) holding X,Y coordinates
+    spatial_index: False always uses the pair pass, even for large n
+    Returns an array of shape (individuals,) with each minimum distance
+    """
+    arr = np.asarray(points_batch, dtype=float)
+    n_ind, n = arr.shape[0], arr.shape[1]
+
+    # Large n: one KD-tree per individual beats the full pair pass
+    if spatial_index and n >= SPATIAL_INDEX_THRESHOLD:
+        return np.array([calcMinEuclideanDistanceIndexed(ind)[0] for ind in arr])
+
+    i_idx, j_idx = np.triu_indices(n, k=1)      # All Point-Pairs with i < j
+
+    min_dist = np.full(n_ind, float("inf"))
+    if len(i_idx) == 0:
+        return min_dist
+
+    for start, stop in _pair_chunks(n_ind, len(i_idx)):
+        chunk = arr[start:stop]
+        dx = chunk[:, i_idx, 0] - chunk[:, j_idx, 0]        # X-cord
+        dy = chunk[:, i_idx, 1] - chunk[:, j_idx, 1]        # Y-cord
+
+        # sqrt is monotonic, so only the smallest squared distance needs it
+        min_dist[start:stop] = np.sqrt(np.min(dx*dx + dy*dy, axis=1))
+
+    return min_dist
+
+# Calculates using a whole batch of Polar Points at once
+def calcMinEuclideanDistancePolarBatch(points_batch, spatial_index=True):
+    """
+    Vectorized calcMinEuclideanDistancePolar for a whole population
+    points_batch: array of shape (individuals, n, 2) holding r,theta coordinates
+    spatial_index: False always uses the pair pass, even for large n
+    Returns an array of shape (individuals,) with each minimum distance
+    """
+    arr = np.asarray(points_batch, dtype=float)
+    n_ind, n = arr.shape[0], arr.shape[1]
+
+    # Large n: one KD-tree per individual beats the full pair pass
+    if spatial_index and n >= SPATIAL_INDEX_THRESHOLD:
+        return np.array([calcMinEuclideanDistancePolarIndexed(ind)[0] for ind in arr])
+
+    i_idx, j_idx = np.triu_indices(n, k=1)      # All Point-Pairs with i < j
+
+    min_dist = np.full(n_ind, float("inf"))
+    if len(i_idx) == 0:
+        return min_dist
+
+    for start, stop in _pair_chunks(n_ind, len(i_idx)):
+        chunk = arr[start:stop]
+        r1, theta1 = chunk[:, i_idx, 0], chunk[:, i_idx, 1]
+        r2, theta2 = chunk[:, j_idx, 0], chunk[:, j_idx, 1]
+
+        d_squared = r1*r1 + r2*r2 - (2*r1*r2*np.cos(theta1 - theta2))
+
+        # Rounding can push coincident points slightly below zero
+        min_dist[start:stop] = np.sqrt(np.maximum(np.min(d_squared, axis=1), 0.0))
+
+    return min_dist
+
+# Calculates using a whole batch of Polar Points without trigonometry
+def calcMinEuclideanDistancePolarTrigBatch(points_batch, unit_batch=None, spatial_index=True):
+    """
+    Same distances as calcMinEuclideanDistancePolarBatch, but taking cached
+    (cos theta, sin theta) per gene, so the pair loop has no trig: the genes
+    become X,Y = r*(cos theta, sin theta) and d^2 = (x1-x2)^2 + (y1-y2)^2,
+    which is exactly 0 for coincident genes
+    unit_batch: (individuals, n, 2) cos/sin of every gene (computed when None)
+    spatial_index: False always uses the pair pass, even for large n
+    """
+    arr = np.asarray(points_batch, dtype=float)
+    if unit_batch is None:
+        unit_batch = polar_unit_vectors_array(arr)
+    return calcMinEuclideanDistanceBatch(arr[:, :, :1] * unit_batch, spatial_index)
+
+def polar_unit_vectors_array(points):
+    """(cos theta, sin theta) of every gene in an (..., 2) array of r,theta"""
+    theta = np.asarray(points, dtype=float)[..., 1]
+    return np.stack((np.cos(theta), np.sin(theta)), axis=-1)
+
+# Calculates using Boundary Points (r = 1) by sorting the angles
+def calcMinDistanceBoundary(points):
+    """
+    Minimum Euclidean distance between points on the unit circle, in O(n log n).
+    With r = 1 the closest pair is the smallest angular gap g between sorted
+    angles (wrap-around included), and its chord is d = 2*sin(g/2)
+    points (p1, p2,...,pn): 1,theta coordinates
+    """
+    return (float(calcMinDistanceBoundaryBatch(np.asarray(points, dtype=float)[None])[0]),)
+
+def calcMinDistanceBoundaryBatch(points_batch, unit_batch=None):
+    """
+    Vectorized calcMinDistanceBoundary for a whole population
+    points_batch: array of shape (individuals, n, 2) holding 1,theta coordinates
+    (unit_batch is accepted for interface parity with the polar evaluators)
+    """
+    arr = np.asarray(points_batch, dtype=float)
+    if arr.shape[1] < 2:
+        return np.full(arr.shape[0], float("inf"))
+
+    theta = np.sort(np.mod(arr[:, :, 1], 2*math.pi), axis=1)
+    gaps = np.diff(theta, axis=1)
+    wrap = theta[:, 0] + 2*math.pi - theta[:, -1]       # Gap across 0 / 2*pi
+
+    min_gap = np.minimum(np.min(gaps, axis=1), wrap)
+    return 2*np.sin(min_gap / 2)
+
+# Point counts at or above this switch from the O(n^2) pair pass to the
+# KD-tree search below (measured crossover on a typical desktop is 100-150)
+SPATIAL_INDEX_THRESHOLD = 128
+
+def _closest_pair_candidates(xy):
+    """
+    Uses a KD-tree over the X,Y coordinates to find every Point-Pair that
+    could be the closest one, in roughly O(n log n).
+    Returns two index arrays (i, j)
+    """
+    from scipy.spatial import cKDTree
+    tree = cKDTree(xy)
+    nn_dist, _ = tree.query(xy, k=2)        # Column 0 is the point itself
+    d = float(np.min(nn_dist[:, 1]))
+
+    # The tree rounds differently from our formulas, so widen the radius a
+    # hair and let the caller re-measure the candidates exactly
+    pairs = tree.query_pairs(r=d * (1 + 1e-9) + 1e-12, output_type='ndarray')
+    return pairs[:, 0], pairs[:, 1]
+
+# Calculates using Cartesian Points and a spatial index
+def calcMinEuclideanDistanceIndexed(points):
+    """
+    Same result as calcMinEuclideanDistance, but only measures the
+    Point-Pairs the KD-tree reports as closest candidates
+    """
+    xy = np.asarray(points, dtype=float)
+    if len(xy) < 2:
+        return (float("inf"),)
+
+    i, j = _closest_pair_candidates(xy)
+    dx = xy[i, 0] - xy[j, 0]
+    dy = xy[i, 1] - xy[j, 1]
+
+    return (float(np.sqrt(np.min(dx*dx + dy*dy))),)
+
+# Calculates using Polar Points and a spatial index
+def calcMinEuclideanDistancePolarIndexed(points):
+    """
+    Same result as calcMinEuclideanDistancePolar, but only measures the
+    Point-Pairs the KD-tree reports as closest candidates
+    """
+    pts = np.asarray(points, dtype=float)
+    if len(pts) < 2:
+        return (float("inf"),)
+
+    r, theta = pts[:, 0], pts[:, 1]
+    xy = np.column_stack((r * np.cos(theta), r * np.sin(theta)))
+
+    i, j = _closest_pair_candidates(xy)
+    d_squared = r[i]*r[i] + r[j]*r[j] - (2*r[i]*r[j]*np.cos(theta[i] - theta[j]))
+
+    return (float(np.sqrt(max(float(np.min(d_squared)), 0.0))),)
+
 # Converts Polar coords to Cartesian
 def polar_to_cart(ind):
     """
@@ -94,12 +283,419 @@ def polar_to_cart(ind):
     return conversion
 
 
+# ===================== FITNESS EVALUATION =====================
+# Children whose genes mostly match their cached copy are re-measured row by
+# row instead of over all n(n-1)/2 pairs. Uniform crossover changes about
+# half the points of most children, so those are rebuilt anyway; below this
+# n the batched pass is cheaper than the rebuilds plus the per-individual
+# bookkeeping (calibrated break-even: about 128-150 points)
+INCREMENTAL_THRESHOLD = 150
+
+# Above this fraction of changed points a full rebuild is cheaper
+INCREMENTAL_MAX_CHANGED = 0.25
+
+@dataclass
+class NeighbourCache:
+    """
+    Genes as they were at the last evaluation plus each point's squared
+    distance to (and index of) its nearest neighbour.
+    Stored on the individual, so toolbox.clone copies it with the genes
+    """
+    points: np.ndarray
+    nn_d2: np.ndarray
+    nn_idx: np.ndarray
+
+@dataclass
+class TrigCache:
+    """
+    Angles as they were at the last evaluation plus their (cos, sin).
+    Stored on polar/boundary individuals next to the NeighbourCache so only
+    mutated genes pay for trig. Small n skips it: one cos/sin per gene over
+    the whole batch is cheaper than cloning the cache with every individual
+    """
+    theta: np.ndarray
+    unit: np.ndarray
+
+def polar_unit_vectors(ind, pts):
+    """
+    (cos theta, sin theta) per gene of ind (pts is its r,theta array),
+    refreshed only where theta changed since the last call
+    """
+    theta = pts[:, 1].copy()
+    cache = getattr(ind, "trig_cache", None)
+
+    if cache is None or cache.theta.shape != theta.shape:
+        unit = polar_unit_vectors_array(pts)
+    else:
+        unit = cache.unit
+        changed = theta != cache.theta
+        if changed.any():
+            unit[changed] = polar_unit_vectors_array(pts[changed])
+
+    ind.trig_cache = TrigCache(theta, unit)
+    return unit
+
+def _sq_dist_rows(pts, rows, unit=None):
+    """
+    Squared distances from each point in rows to every point, shape (len(rows), n).
+    unit holds the cached (cos, sin) of polar genes, None for Cartesian.
+    A point's distance to itself is set to infinity
+    """
+    if unit is not None:
+        pts = pts[:, 0, None] * unit        # Polar genes as X,Y
+    dx = pts[rows, None, 0] - pts[None, :, 0]
+    dy = pts[rows, None, 1] - pts[None, :, 1]
+    d_squared = dx*dx + dy*dy
+
+    d_squared[np.arange(len(rows)), rows] = float("inf")
+    return d_squared
+
+def _nearest_rows(pts, rows, unit=None):
+    """Nearest neighbour (squared distance, index) of each point in rows"""
+    nn_d2 = np.empty(len(rows))
+    nn_idx = np.empty(len(rows), dtype=np.intp)
+
+    # Row blocks keep the distance matrix within BATCH_PAIR_LIMIT
+    step = max(1, BATCH_PAIR_LIMIT // len(pts))
+    for start in range(0, len(rows), step):
+        block = rows[start:start + step]
+        d_squared = _sq_dist_rows(pts, block, unit)
+        nn_idx[start:start + step] = np.argmin(d_squared, axis=1)
+        nn_d2[start:start + step] = d_squared[np.arange(len(block)), nn_idx[start:start + step]]
+
+    return nn_d2, nn_idx
+
+def _nearest_all(pts, unit=None):
+    """Nearest neighbour of every point, through the KD-tree for large n"""
+    n = len(pts)
+    if n < SPATIAL_INDEX_THRESHOLD:
+        return _nearest_rows(pts, np.arange(n), unit)
+
+    from scipy.spatial import cKDTree
+    xy = pts if unit is None else pts[:, 0, None] * unit
+    _, idx = cKDTree(xy).query(xy, k=2)
+
+    # A duplicate point can come back ahead of the point itself
+    nn_idx = np.where(idx[:, 1] == np.arange(n), idx[:, 0], idx[:, 1])
+
+    # Re-measure each pair with our own formula
+    if unit is not None:
+        r = pts[:, 0]
+        nn_d2 = r*r + r[nn_idx]*r[nn_idx] - 2*np.sum(xy * xy[nn_idx], axis=1)
+    else:
+        dx = pts[:, 0] - pts[nn_idx, 0]
+        dy = pts[:, 1] - pts[nn_idx, 1]
+        nn_d2 = dx*dx + dy*dy
+
+    return nn_d2, nn_idx
+
+def _update_neighbour_cache(cache, pts, unit=None):
+    """
+    Brings cache up to date with pts, re-measuring only the rows of points
+    that changed plus the points whose nearest neighbour changed: O(k*n)
+    """
+    changed = np.flatnonzero(np.any(pts != cache.points, axis=1))
+    if len(changed) == 0:
+        return
+
+    # Changed points get a fresh row; the same distances also tell every
+    # other point whether a changed point is now its nearest neighbour
+    d_squared = _sq_dist_rows(pts, changed, unit)
+    closest = np.argmin(d_squared, axis=0)
+    col_d2 = d_squared[closest, np.arange(len(pts))]
+
+    unchanged = np.ones(len(pts), dtype=bool)
+    unchanged[changed] = False
+
+    # Points whose old nearest neighbour moved must search again
+    stale = unchanged & np.isin(cache.nn_idx, changed)
+    closer = unchanged & ~stale & (col_d2 < cache.nn_d2)
+
+    cache.nn_d2[closer] = col_d2[closer]
+    cache.nn_idx[closer] = changed[closest[closer]]
+
+    rows = np.concatenate((changed, np.flatnonzero(stale)))
+    cache.nn_d2[rows], cache.nn_idx[rows] = _nearest_rows(pts, rows, unit)
+    cache.points = pts
+
+# Calculates the fitness of one individual, reusing its cached neighbours
+def evaluate_incremental(ind, polar=False):
+    """
+    Min distance of ind using (and refreshing) its NeighbourCache.
+    Returns the fitness tuple like calcMinEuclideanDistance
+    """
+    pts = np.array(ind, dtype=float)
+    if len(pts) < 2:
+        return (float("inf"),)
+
+    unit = polar_unit_vectors(ind, pts) if polar else None
+    cache = getattr(ind, "nn_cache", None)
+
+    if cache is None or cache.points.shape != pts.shape:
+        changed = len(pts)
+    else:
+        changed = int(np.count_nonzero(np.any(pts != cache.points, axis=1)))
+
+    if changed > INCREMENTAL_MAX_CHANGED * len(pts):
+        # Too much moved, rebuild every row
+        nn_d2, nn_idx = _nearest_all(pts, unit)
+        cache = NeighbourCache(pts, nn_d2, nn_idx)
+        ind.nn_cache = cache
+    else:
+        _update_neighbour_cache(cache, pts, unit)
+
+    return (float(np.sqrt(max(float(np.min(cache.nn_d2)), 0.0))),)
+
+# Evaluates every individual of a list in one batched call
+def fitness_array(individuals):
+    """Fitness of every individual as one array (single-objective)"""
+    return np.fromiter((ind.fitness.values[0] for ind in individuals), dtype=float,
+                       count=len(individuals))
+
+def sel_tournament(individuals, fitness, k, tournsize):
+    """
+    tools.selTournament over a fitness array: the k * tournsize contestants
+    are drawn from `random` exactly as DEAP draws them (so seeded runs do
+    not change), and each tournament's winner is an argmax over the array
+    instead of comparisons between Fitness objects.
+    Ties go to the first contestant drawn, as in DEAP
+    """
+    draw = random.randrange
+    contestants = np.array([draw(len(individuals)) for _ in range(k * tournsize)]).reshape(k, tournsize)
+    winners = contestants[np.arange(k), np.argmax(fitness[contestants], axis=1)]
+    return [individuals[i] for i in winners]
+
+def evaluate_population(individuals, evaluate_batch, polar=False, incremental=True, cache=None):
+    """
+    Stacks the individuals into a single (individuals, n, 2) array, runs
+    the batched evaluator once and assigns the fitness values back.
+    From INCREMENTAL_THRESHOLD points on, each individual is instead
+    re-measured through its NeighbourCache (and, with polar genes, its
+    TrigCache), unless incremental is False because evaluate_batch is
+    already sub-quadratic. With a FitnessCache, genomes seen before are
+    not evaluated again. Returns the number of evaluations performed
+    """
+    if not individuals:
+        return 0
+
+    def evaluate(rows):
+        chosen = [individuals[row] for row in rows]
+        if incremental and len(chosen[0]) >= INCREMENTAL_THRESHOLD:
+            return [evaluate_incremental(ind, polar)[0] for ind in chosen]
+        return evaluate_batch(np.array(chosen, dtype=float))
+
+    if cache is not None:
+        fitnesses, n_evals = evaluate_with_cache(np.array(individuals, dtype=float), evaluate, cache)
+    else:
+        fitnesses, n_evals = evaluate(range(len(individuals))), len(individuals)
+
+    for ind, fit in zip(individuals, fitnesses):
+        ind.fitness.values = (float(fit),)
+
+    return n_evals
+
+# ===================== FITNESS CACHE =====================
+class FitnessCache:
+    """
+    Bounded LRU map from a canonical form of a genome to its fitness.
+    The min distance does not depend on point order, so points are sorted
+    before hashing. With rotation=True genomes are also rotated so the
+    point after the widest angular gap sits at angle 0; the key is then
+    rounded to decimals places, so genomes closer than that share a fitness
+    polar: genes are (r, theta) instead of (X, Y)
+    """
+    def __init__(self, maxsize, polar=False, rotation=False, decimals=9):
+        self.maxsize = maxsize
+        self.polar = polar
+        self.rotation = rotation
+        self.decimals = decimals
+        self.hits = 0
+        self.misses = 0
+        self._store = OrderedDict()
+
+    def canonical_keys(self, points_batch):
+        """One hashable key per individual of an (individuals, n, 2) array"""
+        genes = np.asarray(points_batch, dtype=float)
+
+        if self.rotation:
+            genes = self._rotation_normalised(genes)
+        elif self.polar:
+            genes = np.stack((genes[..., 0], np.mod(genes[..., 1], 2*math.pi)), axis=-1)
+
+        # Sort the points of every individual (first column, then second)
+        order = np.lexsort((genes[..., 1], genes[..., 0]), axis=-1)
+        genes = np.ascontiguousarray(np.take_along_axis(genes, order[..., None], axis=1))
+        return [row.tobytes() for row in genes]
+
+    def _rotation_normalised(self, genes):
+        """Genes as rounded (r, theta) with the anchor point rotated to theta = 0"""
+        if self.polar:
+            r, theta = genes[..., 0], genes[..., 1]
+        else:
+            r, theta = np.hypot(genes[..., 0], genes[..., 1]), np.arctan2(genes[..., 1], genes[..., 0])
+        theta = np.mod(theta, 2*math.pi)
+
+        # Anchor: the point that ends the widest gap between sorted angles
+        sorted_theta = np.sort(theta, axis=1)
+        gaps = np.diff(sorted_theta, axis=1, append=sorted_theta[:, :1] + 2*math.pi)
+        anchor = np.take_along_axis(sorted_theta, (np.argmax(gaps, axis=1)[:, None] + 1) % theta.shape[1], axis=1)
+
+        theta = np.mod(theta - anchor, 2*math.pi)
+        return np.round(np.stack((r, theta), axis=-1), self.decimals) + 0.0    # + 0.0 turns -0.0 into 0.0
+
+    def get(self, key):
+        """Cached fitness of key (marking it recently used), or None"""
+        fit = self._store.get(key)
+        if fit is not None:
+            self._store.move_to_end(key)
+        return fit
+
+    def put(self, key, fit):
+        self._store[key] = fit
+        self._store.move_to_end(key)
+        if len(self._store) > self.maxsize:
+            self._store.popitem(last=False)     # Evict the least recently used
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._store)}
+
+def make_fitness_cache(args, polar=False):
+    """FitnessCache configured from --fitness-cache/--cache-rotation, or None when off"""
+    maxsize = getattr(args, "fitness_cache", 0) or 0
+    if maxsize <= 0:
+        return None
+    return FitnessCache(maxsize, polar=polar, rotation=getattr(args, "cache_rotation", False))
+
+def evaluate_with_cache(points_batch, evaluate, cache):
+    """
+    points_batch: (individuals, n, 2) genes; evaluate(rows) returns the
+    fitness of those rows. Only genomes missing from the cache (once each,
+    even when repeated within the batch) are passed to evaluate.
+    Returns (fitness array, number of evaluations performed)
+    """
+    keys = cache.canonical_keys(points_batch)
+    fitness = np.empty(len(keys))
+    first_row = {}      # key -> first row that needs evaluating
+    repeats = []        # (row, key) of rows sharing a pending key
+
+    for row, key in enumerate(keys):
+        fit = cache.get(key)
+        if fit is not None:
+            fitness[row] = fit
+            cache.hits += 1
+        elif key in first_row:
+            repeats.append((row, key))
+            cache.hits += 1
+        else:
+            first_row[key] = row
+
+    misses = list(first_row.values())
+    if misses:
+        fitness[misses] = evaluate(misses)
+        cache.misses += len(misses)
+        for key, row in first_row.items():
+            cache.put(key, float(fitness[row]))
+
+    for row, key in repeats:
+        fitness[row] = fitness[first_row[key]]
+
+    return fitness, len(misses)
+
+def sum_cache_stats(stats_list):
+    """Adds up the per-run cache stats, None when the cache was off"""
+    stats_list = [cur for cur in stats_list if cur]
+    if not stats_list:
+        return None
+    return {key: sum(cur[key] for cur in stats_list) for key in ("hits", "misses")}
+
+
+# ===================== EARLY STOPPING =====================
+@dataclass(frozen=True)
+class StopRules:
+    stall_window: int = 0                   # Stop after this many generations without improvement (0: off)
+    stall_tol: float = 0.0                  # Gains up to this do not count as improvement
+    target: Optional[float] = None          # Stop once the best fitness reaches this
+    time_budget: Optional[float] = None     # Wall-clock seconds per run
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(stall_window=getattr(args, "stall_window", 0) or 0,
+                   stall_tol=getattr(args, "stall_tol", 0.0) or 0.0,
+                   target=getattr(args, "target", None),
+                   time_budget=getattr(args, "time_budget", None))
+
+    def active(self):
+        return bool(self.stall_window) or self.target is not None or self.time_budget is not None
+
+class EarlyStop:
+    """
+    Checks the stopping rules once per generation. With a target it also
+    records when the target was first reached (time-to-target)
+    """
+    def __init__(self, rules):
+        self.rules = rules
+        self.start = time.perf_counter()
+        self.reason = None              # "stall", "target" or "time" once stopped
+        self.generations = 0            # Generations evolved so far
+        self.time_to_target = None
+        self._best = -float("inf")
+        self._improved = 0              # Generation of the last improvement
+
+    def update(self, generation, best, evaluations):
+        """Records generation's best fitness; returns True when the run should stop"""
+        rules = self.rules
+        self.generations = generation
+        elapsed = time.perf_counter() - self.start
+
+        if best > self._best + rules.stall_tol:
+            self._best, self._improved = best, generation
+
+        if rules.target is not None and best >= rules.target:
+            if self.time_to_target is None:
+                self.time_to_target = {"generation": generation, "evaluations": int(evaluations),
+                                       "seconds": elapsed}
+            self.reason = "target"
+        elif rules.stall_window and generation - self._improved >= rules.stall_window:
+            self.reason = "stall"
+        elif rules.time_budget is not None and elapsed >= rules.time_budget:
+            self.reason = "time"
+
+        return self.reason is not None
+
+    def result(self):
+        """Keys added to a run's result"""
+        return {"generations": self.generations, "stop_reason": self.reason,
+                "time_to_target": self.time_to_target}
+
+def forward_fill(series, length):
+    """series padded to length with its last value (curves of runs that stopped early)"""
+    return list(series) + [series[-1]] * (length - len(series))
+
+def summarize_stopping(runs):
+    """
+    Generations used, stop reasons and time-to-target over the results of
+    an experiment's runs
+    """
+    generations = [run["generations"] for run in runs]
+    hits = [run["time_to_target"] for run in runs if run["time_to_target"] is not None]
+    return {
+        "generations": {"mean": float(np.mean(generations)), "min": min(generations),
+                        "max": max(generations), "total": sum(generations)},
+        "stop_reasons": dict(Counter(run["stop_reason"] or "completed" for run in runs)),
+        "time_to_target": {
+            "hits": len(hits),
+            "generation": float(np.mean([hit["generation"] for hit in hits])) if hits else None,
+            "evaluations": float(np.mean([hit["evaluations"] for hit in hits])) if hits else None,
+            "seconds": float(np.mean([hit["seconds"] for hit in hits])) if hits else None,
+        },
+    }
 
 # ===================== STATS =====================
 def mean_std_ci95(values: List[float]) -> tuple[float, float, tuple[float, float]]:
     """
     Statistical information for final fitness
     """
+    from scipy import stats
     arr = np.array(values)
     n = len(arr)                # Sample size
     mean = float(np.mean(arr))
@@ -115,6 +711,7 @@ def mean_std_ci95(values: List[float]) -> tuple[float, float, tuple[float, float
     return mean, std, (ci_low, ci_high)
 
 def per_gen_mean_ci(series_2d: List[List[float]]):      
+    from scipy import stats
     arr = np.array(series_2d, dtype=float)
     n = arr.shape[0]            
     mean = np.mean(arr, axis=0)
@@ -128,6 +725,60 @@ def per_gen_mean_ci(series_2d: List[List[float]]):
     
     return mean, ci_low, ci_high
 
+class RunningStats:
+    """
+    Streaming (Welford) mean and variance of equal-length series, such as
+    one best-by-generation curve per run, or of scalars. Memory is one
+    series however many runs are added, and accumulators filled in
+    different processes combine with merge()
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = None
+        self.m2 = None          # Sum of squared deviations from the mean
+
+    def add(self, values):
+        x = np.array(values, dtype=float)
+        self.count += 1
+        if self.mean is None:
+            self.mean = x
+            self.m2 = np.zeros_like(x)
+            return
+        delta = x - self.mean
+        self.mean = self.mean + delta / self.count
+        self.m2 = self.m2 + delta * (x - self.mean)
+
+    def merge(self, other: "RunningStats"):
+        """Adds the runs counted by another accumulator (Chan et al.)"""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean.copy(), other.m2.copy()
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / count)
+        self.m2 = self.m2 + other.m2 + delta * delta * (self.count * other.count / count)
+        self.count = count
+        return self
+
+    def std(self):
+        """Sample standard deviation (ddof=1)"""
+        return np.sqrt(self.m2 / (self.count - 1))
+
+    def mean_ci95(self):
+        """(mean, CI low, CI high) with the t-interval of per_gen_mean_ci"""
+        from scipy import stats
+        sem = self.std() / np.sqrt(self.count)
+        ci_low, ci_high = stats.t.interval(confidence=0.95, df=self.count-1, loc=self.mean, scale=sem)
+        return self.mean, ci_low, ci_high
+
+    def summary(self):
+        """Scalar series: (mean, std, (CI low, CI high)) as mean_std_ci95"""
+        mean, ci_low, ci_high = self.mean_ci95()
+        return float(mean), float(self.std()), (ci_low, ci_high)
+
 def print_results(representation: str, results: dict):
     print(f"Printing {representation} results........")
     # Prints the final stat results
@@ -135,7 +786,7 @@ def print_results(representation: str, results: dict):
     mean_f = stats["mean"]
     std_f = stats["std"]
     CI_low, CI_high = stats["CI95"]
-    best_overall_fitness = max(results["best_overall_all"])
+    best_overall_fitness = results["best_overall"]
 
     print(f"\n{representation} final stats:")
     print(f"MEAN: {mean_f:.3f}")
@@ -148,47 +799,43 @@ def print_results(representation: str, results: dict):
 
     print(f"Best mean fitness at final generation: {gen_m[-1]:.3f}")    # [-1] gets final item
 
+    cache_stats = results.get("cache_stats")
+    if cache_stats:
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        print(f"Fitness cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+              f"({100 * cache_stats['hits'] / max(1, lookups):.1f}% hit rate)")
+
+    if results.get("profile"):
+        print(profiling.format_table(results["profile"]))
+
+    stopping = results.get("stopping")
+    if stopping:
+        gens = stopping["generations"]
+        reasons = ", ".join(f"{reason} {count}" for reason, count in sorted(stopping["stop_reasons"].items()))
+        print(f"Generations used: mean {gens['mean']:.1f} (min {gens['min']}, max {gens['max']}); runs {reasons}")
+        hit = stopping["time_to_target"]
+        if hit["hits"]:
+            print(f"Target reached in {hit['hits']}/{results['n_runs']} runs: mean generation {hit['generation']:.1f}, "
+                  f"{hit['evaluations']:.0f} evaluations, {hit['seconds']:.3f}s")
+
 
 
 # ===================== Plotting =====================
 # Plot fitness (minimum distance) over generations
-def plot_fitness_log(log, title, filename):
-    generations = []
-    fitness_values = []
-
-    for entry in log:
-        gen = entry[0]          # First element is generation number
-        fitness = entry[1]      # Second element is fitness value
-        generations.append(gen)
-        fitness_values.append(fitness)
-    
-    # Figure setup
-    plt.figure(figsize=(10, 6))
-    plt.plot(generations, fitness_values, linewidth=2, color='blue')
-    plt.xlabel('Generation', fontsize=12)
-    plt.ylabel('Minimum Pairwise Distance', fontsize=12)
-    plt.title(title, fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3)
-    
-    # Add label to the last point
-    best_gen = generations[-1]
-    best_fitness = fitness_values[-1]
-    plt.plot(best_gen, best_fitness, 'ro', markersize=8)
-    plt.annotate(f'Gen {best_gen}: {best_fitness:.4f}',
-                xy=(best_gen, best_fitness),
-                xytext=(-80, 10),
-                textcoords='offset points',
-                fontsize=10,
-                bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=1),
-                arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
-    
-    # Save Plot
-    plt.tight_layout()
-    plt.savefig(f'graphs/{filename}', dpi=300, bbox_inches='tight')
-    plt.close()
+def plot_fitness_log(log, title, filename, options=None):
+    import plotting         # Loads matplotlib on first plot
+    plotting.render(plotting.PlotJob("fitness", log, title, filename), options)
 
 # Log point positions for each generation
 def log_generation(log_file, generation, points):
+    # Join all strings
+    points_str = ', '.join(format_points(points))
+    
+    # Write to log
+    log_file.write(f"Gen {generation}: [{points_str}]\n")
+
+def format_points(points):
+    """Each point as the '(x,y)' string used in the logs"""
     points_list = []
     for point in points:
         x = point[0]
@@ -197,45 +844,79 @@ def log_generation(log_file, generation, points):
         # Format the point as a string with 6 decimal places
         point_str = f'({x:.6f},{y:.6f})'
         points_list.append(point_str)
-    
-    # Join all strings
-    points_str = ', '.join(points_list)
-    
-    # Write to log
-    log_file.write(f"Gen {generation}: [{points_str}]\n")
 
-# Plot points on graph with circle
-def plot_point_distribution(points, title, filename):
-    xs = [x[0] for x in points]
-    ys = [y[1] for y in points]
-
-    plt.figure(figsize=(6, 6))
+    return points_list
 
-    # Plot points
-    plt.scatter(xs, ys)
+# Plot points on graph with circle
+def plot_point_distribution(points, title, filename, options=None):
+    import plotting
+    plotting.render(plotting.PlotJob("distribution", points, title, filename), options)
 
-    # Draw unit circle
-    circle = plt.Circle((0, 0), 1.0, fill=False, linewidth=2)
-    plt.gca().add_artist(circle)
 
-    # Draw origin
-    plt.plot(0, 0, 'ro', markersize=5)
+# ===================== PARALLEL RUNS =====================
+def setup_creator():
+    """
+    DEAP creator setup, once per process.
+    The parent needs the classes too, to unpickle individuals from workers
+    """
+    if not hasattr(creator, "FitnessMax"):
+        creator.create("FitnessMax", base.Fitness, weights=(1.0,))
 
-    # Formatting
-    plt.xlabel('X', fontsize=12)
-    plt.ylabel('Y', fontsize=12)
-    plt.title(title, fontsize=14, fontweight='bold')
-    plt.axis('equal')
-    plt.xlim(-1.1, 1.1)
-    plt.ylim(-1.1, 1.1)
-    plt.gca().set_aspect('equal', adjustable='box')
-    plt.grid(True, alpha=0.3)
+    if not hasattr(creator, "Individual"):
+        creator.create("Individual", list, fitness=creator.FitnessMax)
 
-    # Save figure
-    plt.tight_layout()
-    plt.savefig(f'graphs/{filename}', dpi=300, bbox_inches='tight')
-    plt.close()
+def _run_in_worker(run_single, args):
+    """Pool worker: a run plus its queued background I/O, before reporting back"""
+    result = run_single(args)
+    background.flush()
+    return result
 
+def run_seeds(run_single, args, seeds):
+    """
+    Calls run_single once per seed and yields the results in seed order.
+    With args.workers > 1 the runs are spread over a process pool; every
+    run reseeds random/np.random itself, so the results are identical to
+    the serial loop
+    """
+    workers = getattr(args, "workers", 1) or 1
+
+    if workers <= 1 or len(seeds) <= 1:
+        for seed in seeds:
+            args.seed = seed        # Creates a unique cfg for each run
+            yield run_single(args)
+        return
+
+    # Each worker gets its own copy of args. Only the last seed writes
+    # the text log, matching the file the serial loop leaves behind
+    run_args = []
+    for seed in seeds:
+        cur = copy.copy(args)
+        cur.seed = seed
+        cur.write_log = seed == seeds[-1]
+        run_args.append(cur)
+
+    setup_creator()
+    background.flush()      # No forking while the writer thread is mid-job
+    with ProcessPoolExecutor(max_workers=min(workers, len(seeds))) as executor:
+        yield from executor.map(functools.partial(_run_in_worker, run_single), run_args)
+
+    args.seed = seeds[-1]
+
+
+# ===================== RUN RESULTS =====================
+def run_result(best_by_gen, avg_by_gen, best_individual, best_fitness, evaluations, fit_cache, stop, profile, cfg):
+    """One run's result, as every engine returns it and experiments.summarize_experiment reads it"""
+    return {
+        "best_by_gen": best_by_gen,
+        "avg_by_gen": avg_by_gen,
+        "best_individual": best_individual,
+        "best_overall_fitness": best_fitness,
+        "evaluations": evaluations,    # Fitness evaluations (cache hits excluded)
+        "cache_stats": fit_cache.stats() if fit_cache else None,
+        **stop.result(),            # Generations used, why the run stopped, time-to-target
+        "profile": profile,         # None without --profile
+        "config": asdict(cfg)       # Current GA settings
+    }
 
 # ===================== GA Configuration Dataclass =====================
 # Configuration dataclass